@@ -1,6 +1,29 @@
 from pprint import pprint
 
-from pytest import fixture
+from pytest import fixture, mark
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="Also run tests marked as slow (long benchmarks / scaling tests).",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: only runs when --run-slow is given")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow"):
+        return
+
+    skip_slow = mark.skip(reason="Slow test; use --run-slow to run it.")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
 
 
 @fixture(autouse=True)
@@ -1,6 +1,4 @@
-from functools import reduce
 from math import log2
-import operator
 
 from redhdl.assembly.placement import (
     InstancePlacement,
@@ -32,8 +30,9 @@ def dest_pin_buses(
     instances_region = placement_region(netlist, placement).xz_padded(1)
 
     dest_pin_buses: PinBuses = {}
+    # Running union of dest_pin_buses.values().
+    other_buses = RedstoneBussing()
     for pin_pos_pair in source_dest_pin_pos_pairs(netlist, placement):
-        other_buses = reduce(operator.or_, dest_pin_buses.values(), RedstoneBussing())
         bussing = redstone_bussing(
             start_pos=pin_pos_pair.source_pin_pos,
             end_pos=pin_pos_pair.dest_pin_pos,
@@ -45,6 +44,7 @@ def dest_pin_buses(
         )
 
         dest_pin_buses[pin_pos_pair.dest_pin_id] = bussing
+        other_buses |= bussing
 
     return dest_pin_buses
 
@@ -137,6 +137,7 @@ from random import choice
 from typing import Any, Literal, NamedTuple, Optional, cast
 
 from frozendict import frozendict
+import numpy as np
 
 from redhdl.bussing.errors import (
     BussingImpossibleError,
@@ -272,6 +273,13 @@ class RedstoneBussing:
     def element_blocks(self) -> set[Pos]:
         return set(self.element_sig_strengths)
 
+    @cached_property
+    def element_coords_array(self) -> np.ndarray:
+        """Element block positions as an (N, 3) array."""
+        return np.array(tuple(self.element_sig_strengths), dtype=np.int32).reshape(
+            -1, 3
+        )
+
     @cached_property
     def non_element_blocks(self) -> set[Pos]:
         return (self.foundation_blocks | self.spacer_blocks) - self.element_blocks
@@ -531,15 +539,18 @@ class RedstoneBussing:
 
         # [COLLISION 1] Foundation and wire/repeater blocks don't conflict with existing foundation,
         #     wire/repeater blocks.
-        placement_blocks = {step.next_pos, below_block}
-        preexisting_placement_blocks = (
-            other_buses.element_blocks
-            | other_buses.element_foundation_blocks
-            | self.element_blocks
-            | self.element_foundation_blocks
-            | instance_points
-        )
-        if not at_end_pos and len(placement_blocks & preexisting_placement_blocks) > 0:
+        # Probe each set rather than unioning them; instance_points alone can be huge.
+        if not at_end_pos and any(
+            placement_block in preexisting_blocks
+            for placement_block in (step.next_pos, below_block)
+            for preexisting_blocks in (
+                other_buses.element_blocks,
+                other_buses.element_foundation_blocks,
+                self.element_blocks,
+                self.element_foundation_blocks,
+                instance_points,
+            )
+        ):
             return None
 
         if step.is_wire:
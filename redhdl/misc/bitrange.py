@@ -4,6 +4,8 @@ Bitrange: Handling (inclusive) sets of (start_index, end_index) integer ranges.
 Largely used to handle vHDL bitarray index slice logic.
 """
 
+from itertools import chain
+
 from redhdl.misc.slice import Slice
 from redhdl.netlist.netlist import Port  # To support Port pin_count => BitRange.
 
@@ -11,7 +13,7 @@ BitRange = tuple[int, int]
 
 
 def flattened_bitranges(bitranges: set[tuple[int, int]]) -> set[int]:
-    return set.union(*(set(range(start, end + 1)) for (start, end) in bitranges))
+    return set(chain.from_iterable(range(start, end + 1) for (start, end) in bitranges))
 
 
 def bitranges_valid(bitranges: set[tuple[int, int]]) -> bool:
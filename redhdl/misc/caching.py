@@ -1,4 +1,5 @@
 from functools import wraps
+from weakref import finalize
 
 
 class CachingError(BaseException):
@@ -29,3 +30,47 @@ def first_id_cached(func):
             raise result
 
     return wrapper
+
+
+def weak_id_cached(func):
+    """
+    Cache results by the id() of every (positional) argument.
+
+    Unlike functools.cache, this never hashes the arguments (hashing a large frozen
+    dataclass walks its entire tree) and never keeps them alive: each entry is
+    evicted when any of its arguments is garbage collected, so a recycled id()
+    can't produce a stale hit. Arguments must support weak references.
+
+    Each argument object gets a single finalizer (on its first cache miss), which
+    evicts every entry that object appears in.
+    """
+    func._cache = {}
+    # Cache keys each live argument (by id) appears in.
+    keys_by_arg_id: dict[int, set[tuple[int, ...]]] = {}
+
+    def evict(arg_id: int) -> None:
+        for key in keys_by_arg_id.pop(arg_id, ()):
+            func._cache.pop(key, None)
+            for other_id in key:
+                if other_id != arg_id and other_id in keys_by_arg_id:
+                    keys_by_arg_id[other_id].discard(key)
+
+    @wraps(func)
+    def wrapper(*args):
+        key = tuple(map(id, args))
+        try:
+            return func._cache[key]
+        except KeyError:
+            pass
+
+        result = func._cache[key] = func(*args)
+        for arg, arg_id in zip(args, key, strict=True):
+            arg_keys = keys_by_arg_id.get(arg_id)
+            if arg_keys is None:
+                arg_keys = keys_by_arg_id[arg_id] = set()
+                finalize(arg, evict, arg_id)
+            arg_keys.add(key)
+
+        return result
+
+    return wrapper
@@ -21,6 +21,7 @@ TODO
 - Propagate preferred bitwidth across networks / between netlists for generated / logical units
 """
 
+from functools import cache
 from string import ascii_uppercase
 from typing import Any
 
@@ -36,10 +37,9 @@ from redhdl.vhdl.analysis import arches_from_vhdl_path
 from redhdl.vhdl.models import ReferenceExpr, VHDLArchitectureName
 
 
+@cache
 def _camel_case(value: str) -> str:
-    return "_".join(
-        ((part[0].upper() + part[1:]) if part else "") for part in value.split("_")
-    )
+    return "_".join(part[:1].upper() + part[1:] for part in value.split("_"))
 
 
 def _snake_from_camel(value: str) -> str:
@@ -0,0 +1,120 @@
+"""
+Grid A*: a specialized A* search for unit-cost, 4-connected planar grids.
+
+Generic PathSearchProblems pay for a handful of method calls and Step allocations
+per expansion. For plain wall grids, astar_grid instead searches directly over
+flat integer node ids (z * width + x) with flat per-node cost / parent tables.
+"""
+
+from heapq import heappop, heappush
+from math import inf
+
+import numpy as np
+
+from redhdl.search.path_search import NoSolutionError, SearchTimeoutError
+
+# Default (dx, dz) steps; astar_grid returns indices into whichever deltas it's given.
+GRID_DELTAS: tuple[tuple[int, int], ...] = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+def path_from_parents(
+    parents: list[int],
+    parent_deltas: list[int],
+    start: int,
+    end: int,
+    path_len: int,
+) -> list[int]:
+    """
+    Walk the parent table back from end to start, filling a preallocated path.
+
+    With unit step costs, path_len is just end's path cost.
+
+    >>> parents = [-1, 0, 1, -1]
+    >>> parent_deltas = [-1, 0, 2, -1]
+    >>> path_from_parents(parents, parent_deltas, start=0, end=2, path_len=2)
+    [0, 2]
+    """
+    path = [0] * path_len
+    node = end
+    for path_index in range(path_len - 1, -1, -1):
+        path[path_index] = parent_deltas[node]
+        node = parents[node]
+
+    assert node == start, "Path length doesn't match the parent chain."
+    return path
+
+
+def astar_grid(
+    walls: np.ndarray,
+    sx: int,
+    sz: int,
+    ex: int,
+    ez: int,
+    deltas: tuple[tuple[int, int], ...] = GRID_DELTAS,
+    max_steps: int = 10_000,
+) -> list[int]:
+    """
+    Find a shortest path across a boolean (x, z) wall grid from (sx, sz) to (ex, ez).
+
+    Returns the path as a list of indices into deltas. Positions off the grid are
+    treated as walls; pad the grid if the search should be able to go around it.
+
+    >>> walls = np.zeros((3, 3), dtype=np.bool_)
+    >>> walls[1, 0:2] = True
+    >>> [GRID_DELTAS[index] for index in astar_grid(walls, 0, 0, 2, 0)]
+    [(0, 1), (0, 1), (1, 0), (1, 0), (0, -1), (0, -1)]
+    >>> walls[1, 2] = True
+    >>> astar_grid(walls, 0, 0, 2, 0)
+    Traceback (most recent call last):
+      ...
+    redhdl.search.path_search.NoSolutionError: Grid search problem has no solutions.
+    """
+    width, height = walls.shape
+    # Column-major ravel so flat index z * width + x matches walls[x, z].
+    open_nodes = (~walls).ravel(order="F").tolist()
+    start, end = sz * width + sx, ez * width + ex
+
+    node_costs = [inf] * (width * height)
+    parents = [-1] * (width * height)
+    parent_deltas = [-1] * (width * height)
+    explored = [False] * (width * height)
+
+    node_costs[start] = 0
+    heap = [(abs(sx - ex) + abs(sz - ez), 0, start)]
+    remaining_steps = max_steps
+    while heap and remaining_steps > 0:
+        _, neg_cost, node = heappop(heap)
+        if explored[node]:
+            continue
+
+        if node == end:
+            return path_from_parents(parents, parent_deltas, start, end, -neg_cost)
+
+        explored[node] = True
+        remaining_steps -= 1
+
+        z, x = divmod(node, width)
+        next_cost = 1 - neg_cost
+        for delta_index, (dx, dz) in enumerate(deltas):
+            next_x, next_z = x + dx, z + dz
+            if not (0 <= next_x < width and 0 <= next_z < height):
+                continue
+
+            next_node = next_z * width + next_x
+            if open_nodes[next_node] and next_cost < node_costs[next_node]:
+                node_costs[next_node] = next_cost
+                parents[next_node] = node
+                parent_deltas[next_node] = delta_index
+                heappush(
+                    heap,
+                    (
+                        next_cost + abs(next_x - ex) + abs(next_z - ez),
+                        -next_cost,
+                        next_node,
+                    ),
+                )
+
+    if heap:
+        raise SearchTimeoutError(f"Could not find solution in {max_steps} steps.")
+    else:
+        raise NoSolutionError("Grid search problem has no solutions.")
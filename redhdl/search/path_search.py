@@ -27,8 +27,8 @@ failure.
 from abc import ABCMeta, abstractmethod
 from collections.abc import Generator
 from dataclasses import dataclass, field
-from functools import cached_property
 from heapq import heappop, heappush
+from itertools import count
 from math import inf
 from typing import Generic, Literal, Optional, TypeVar
 
@@ -83,16 +83,17 @@ class Step(Generic[State, Action]):
         return list(reversed(sequence))[1:]  # First action is always None.
 
     def next_steps(self, problem: PathSearchProblem) -> Generator["Step", None, None]:
-        for action in sorted(problem.state_actions(self.state)):
+        state, cost = self.state, self.cost
+        state_action_result = problem.state_action_result
+        state_action_cost = problem.state_action_cost
+        min_cost = problem.min_cost
+        for action in sorted(problem.state_actions(state)):
             yield Step(
-                state=(next_state := problem.state_action_result(self.state, action)),
+                state=(next_state := state_action_result(state, action)),
                 parent_step=self,
                 action=action,
-                cost=(
-                    next_cost := self.cost
-                    + problem.state_action_cost(self.state, action)
-                ),
-                min_cost=next_cost + problem.min_cost(next_state),
+                cost=(next_cost := cost + state_action_cost(state, action)),
+                min_cost=next_cost + min_cost(next_state),
             )
 
     @staticmethod
@@ -109,7 +110,7 @@ class Step(Generic[State, Action]):
     def depth(self) -> int:
         return len(self.action_sequence())
 
-    @cached_property
+    @property
     def key(self) -> tuple[float, float]:
         """
         The sorting key for Steps.
@@ -239,27 +240,39 @@ def a_star_bfs_searched_solution(
     problem: PathSearchProblem[State, Action],
     max_steps: int = 10_000,
 ) -> list[Action]:
+    # Heap entries are (*step.key, tiebreak, step) tuples: the C-level tuple
+    # comparison avoids calling Step.__lt__ on every sift, and the insertion
+    # counter deterministically breaks ties between equal-key steps (FIFO).
+    tiebreaks = count()
     first_step = Step.initial_step(problem.initial_state())
-    next_best_action_heap = [first_step]
+    next_best_action_heap = [(*first_step.key, next(tiebreaks), first_step)]
 
     explored_states: set[State] = set()
 
+    # Bound once as locals; these are called for every expanded / generated step.
+    push, pop = heappush, heappop
+    is_goal_state, expanding_step = problem.is_goal_state, problem.expanding_step
+    explore = explored_states.add
+
     remaining_steps = max_steps
     while len(next_best_action_heap) > 0 and remaining_steps > 0:
-        step = heappop(next_best_action_heap)
+        step = pop(next_best_action_heap)[-1]
         if step.state in explored_states:
             continue
 
-        if problem.is_goal_state(step.state):
+        if is_goal_state(step.state):
             return step.action_sequence()
 
-        explored_states.add(step.state)
+        explore(step.state)
 
-        problem.expanding_step(step)  # Just for debugging.
+        expanding_step(step)  # Just for debugging.
         for next_step in step.next_steps(problem):
             # Optional, but slightly slows things down:
             # if next_step.state not in explored_states
-            heappush(next_best_action_heap, next_step)
+            push(
+                next_best_action_heap,
+                (*next_step.key, next(tiebreaks), next_step),
+            )
 
         remaining_steps -= 1
 
@@ -106,11 +106,13 @@ from redhdl.vhdl.parse_tree import (
     ParseTree,
     called_on_node_type,
     children_of_type,
+    compile_path,
     get_assert_text,
     parse_tree_assert_get,
     parse_tree_assert_get_text,
     parse_tree_from_file,
     parse_tree_get,
+    parse_tree_get_compiled,
     parse_tree_query,
     str_from_parse_tree,
 )
@@ -400,7 +402,7 @@ def const_from_quoted_str(value: str) -> int:
     return int(raw_value, base=base)
 
 
-_index_path: list[str | int] = [
+_index_path = compile_path(
     "function_call_or_indexed_name_part",
     "actual_parameter_part",
     "association_list",
@@ -417,16 +419,16 @@ _index_path: list[str | int] = [
     "literal",
     "numeric_literal",
     "abstract_literal",
-]
+)
 
-_bitrange_base_path: list[str | int] = [
+_bitrange_base_path = compile_path(
     "slice_name_part",
     "discrete_range",
     "range_decl",
     "explicit_range",
-]
+)
 
-_bitrange_each_index_path: list[str | int] = [
+_bitrange_each_index_path = compile_path(
     # There are multiple simple_expressions per explicit_range. Use children_of_type().
     # "simple_expression",
     "term",
@@ -436,24 +438,25 @@ _bitrange_each_index_path: list[str | int] = [
     "numeric_literal",
     "abstract_literal",
     0,
-]
+)
 
 
 @called_on_node_type("name_part")
 def bitrange_from_name_part(name_part_node: ParseTree) -> BitRange | None:
-    index_node = parse_tree_get(name_part_node, *_index_path)
+    index_node = parse_tree_get_compiled(name_part_node, _index_path)
     if index_node is not None:
         index = int(get_assert_text(index_node.children[0]))
         return (index, index)
 
-    index_range_base_node = parse_tree_get(name_part_node, *_bitrange_base_path)
+    index_range_base_node = parse_tree_get_compiled(name_part_node, _bitrange_base_path)
     if index_range_base_node is None:
         raise ValueError("Expected either bit index or bit range, found neither.")
 
     indices = [
         int(get_assert_text(index_node))
         for child in children_of_type(index_range_base_node, "simple_expression")
-        if (index_node := parse_tree_get(child, *_bitrange_each_index_path)) is not None
+        if (index_node := parse_tree_get_compiled(child, _bitrange_each_index_path))
+        is not None
     ]
     if len(indices) != 2:
         raise ValueError("Bitrange AST looks malformed.")
@@ -468,8 +471,8 @@ _alias_base_path = [
 
 
 _alias_identifier_node_paths = [
-    _alias_base_path + ["name", "identifier"],
-    _alias_base_path + ["literal", "enumeration_literal", "identifier"],
+    compile_path(*_alias_base_path, "name", "identifier"),
+    compile_path(*_alias_base_path, "literal", "enumeration_literal", "identifier"),
 ]
 
 
@@ -513,9 +516,9 @@ def alias_from_term_node(alias_expr_node: ParseTree) -> ReferenceExpr | None:
         child_node
         for alias_id_node_path in _alias_identifier_node_paths
         if (
-            child_node := parse_tree_get(
+            child_node := parse_tree_get_compiled(
                 alias_expr_node,
-                *alias_id_node_path,
+                alias_id_node_path,
                 raise_on_ambiguous=False,
             )
         )
@@ -1,9 +1,8 @@
-from redhdl.vhdl.antlr_parser import display_parse_tree, vhdl_tree_from_file
+from redhdl.vhdl.parse_tree import parse_tree_from_file, pprint_tree
 
 
 def main():
-    hdl_tree = vhdl_tree_from_file("hdl_examples/adder_chain.vhdl")
-    display_parse_tree(hdl_tree)
+    pprint_tree(parse_tree_from_file("hdl_examples/adder_chain.vhdl"))
 
 
 if __name__ == "__main__":
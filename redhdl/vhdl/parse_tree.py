@@ -3,8 +3,9 @@ Simplified parse-tree to replace antlr's overly-robust ParseTree implementation.
 """
 
 from dataclasses import dataclass, field
-from functools import wraps
-from pprint import pformat, pprint
+from functools import cache, cached_property, wraps
+from pprint import pformat
+from sys import intern
 from typing import Any, Callable
 
 from antlr4.tree.Tree import ParseTree as ANTLRParseTree
@@ -20,8 +21,7 @@ class ParseTree:
     """
     Simple python representation of the verible antlr parse tree.
     Text only provived for terminal nodes.
-    Children are slots; not all slots are filled (Nones.)
-    Start / end may or may not be available for nonterminals.
+    Children are never None; parse_tree_from_antlr() drops ANTLR's empty slots.
     """
 
     node_type: str
@@ -31,6 +31,23 @@ class ParseTree:
     def terminal(self):
         return len(self.children) == 0
 
+    @cached_property
+    def children_by_type(self) -> dict[str, list["ParseTree"]]:
+        """
+        Children grouped by node_type (in order), so path lookups on wide nodes
+        don't rescan every child. Built on first use; children shouldn't be
+        modified afterwards.
+
+        >>> node = parsed("a, b, c", "identifier_list")
+        >>> {node_type: len(nodes) for node_type, nodes in node.children_by_type.items()}
+        {'identifier': 3, ',': 2}
+        """
+        children_by_type: dict[str, list[ParseTree]] = {}
+        for child in self.children:
+            children_by_type.setdefault(child.node_type, []).append(child)
+
+        return children_by_type
+
 
 def parse_tree_from_antlr(antlr_parse_tree: ANTLRParseTree) -> ParseTree:
     # In ANTLR land, node_text is the node_type for nonterminals, and the actual text symbol
@@ -39,11 +56,13 @@ def parse_tree_from_antlr(antlr_parse_tree: ANTLRParseTree) -> ParseTree:
         antlr_parse_tree, ruleNames=vhdlParser.ruleNames
     )
 
+    # Node types and terminal tokens ('(', ';', 'ieee', ...) repeat thousands of times
+    # per design; intern them so duplicates share one string and compare by identity.
     if antlr_parse_tree.getChildCount() == 0:
-        node_type = antlr_node_text.upper()
-        text = antlr_node_text
+        node_type = intern(antlr_node_text.upper())
+        text = intern(antlr_node_text)
     else:
-        node_type = antlr_node_text
+        node_type = intern(antlr_node_text)
         text = None
 
     return ParseTree(
@@ -103,17 +122,103 @@ def simplified_tree(parse_tree: ParseTree) -> SimplifiedTree:
         assert parse_tree.text is not None  # For MyPy.
         return parse_tree.text
 
-    parts = [
-        simplified_tree(child) for child in parse_tree.children if child is not None
-    ]
+    parts = [simplified_tree(child) for child in parse_tree.children]
     if len(parts) == 1:
         return parts[0]
     else:
         return parts
 
 
-def pformatted_tree(parse_tree: ParseTree) -> str:
-    return pformat(simplified_tree(parse_tree))
+def _flat_repr_lengths(tree: SimplifiedTree) -> dict[int, int]:
+    """
+    Single-line repr() length of every list in a simplified tree, by id().
+    """
+    flat_lengths: dict[int, int] = {}
+    remaining: list[tuple[list[Any], bool]] = (
+        [(tree, False)] if isinstance(tree, list) else []
+    )
+    while remaining:
+        subtree, children_measured = remaining.pop()
+        if children_measured:
+            flat_lengths[id(subtree)] = (
+                2  # Brackets.
+                + sum(
+                    len(repr(child))
+                    if isinstance(child, str)
+                    else flat_lengths[id(child)]
+                    for child in subtree
+                )
+                + 2 * max(len(subtree) - 1, 0)  # Separators.
+            )
+        else:
+            remaining.append((subtree, True))
+            remaining.extend(
+                (child, False) for child in subtree if isinstance(child, list)
+            )
+
+    return flat_lengths
+
+
+def pformatted_tree(
+    parse_tree: ParseTree,
+    width: int = 80,
+    use_pformat: bool = False,
+) -> str:
+    """
+    pformat() of the simplified tree, without pprint's per-level repr() and
+    recursion overhead. Lists are laid out exactly as pprint would; the one
+    difference is that overlong strings stay on one line rather than being split.
+
+    >>> parse_tree = parse_tree_from_file("hdl_examples/adder_chain.vhdl")
+    >>> pformatted_tree(parse_tree) == pformatted_tree(parse_tree, use_pformat=True)
+    True
+    >>> print(pformatted_tree(parsed("a(1 downto 0)", "name"), width=20))
+    ['a',
+     ['(',
+      ['1',
+       'downto',
+       '0'],
+      ')']]
+    """
+    tree = simplified_tree(parse_tree)
+    if use_pformat:
+        return pformat(tree, width=width)
+
+    flat_lengths = _flat_repr_lengths(tree)
+
+    parts: list[str] = []
+    # Either text to emit as-is, or a (subtree, indent, allowance) to lay out, where
+    # allowance is the room reserved for closing brackets that follow the subtree.
+    remaining: list[str | tuple[SimplifiedTree, int, int]] = [(tree, 0, 0)]
+    while remaining:
+        item = remaining.pop()
+        if isinstance(item, str):
+            parts.append(item)
+            continue
+
+        subtree, indent, allowance = item
+        if (
+            isinstance(subtree, str)
+            or len(subtree) == 0
+            or flat_lengths[id(subtree)] <= width - indent - allowance
+        ):
+            parts.append(repr(subtree))
+            continue
+
+        # Too wide: one child per line, aligned just past the opening bracket.
+        child_indent = indent + 1
+        separator = ",\n" + " " * child_indent
+        last_index = len(subtree) - 1
+
+        parts.append("[")
+        remaining.append("]")
+        for index in range(last_index, -1, -1):
+            child_allowance = allowance + 1 if index == last_index else 1
+            remaining.append((subtree[index], child_indent, child_allowance))
+            if index > 0:
+                remaining.append(separator)
+
+    return "".join(parts)
 
 
 def pprint_tree(parse_tree: ParseTree) -> None:
@@ -139,14 +244,27 @@ def pprint_tree(parse_tree: ParseTree) -> None:
        ';']],
      '<EOF>']
     """
-    pprint(simplified_tree(parse_tree))
+    print(pformatted_tree(parse_tree))
 
 
 def str_from_parse_tree(parse_tree: ParseTree) -> str:
-    if parse_tree.text is not None:
-        return parse_tree.text
-    else:
-        return " ".join(str_from_parse_tree(child) for child in parse_tree.children)
+    """
+    Source-ish text of a parse tree; its terminals' text, space separated.
+
+    >>> str_from_parse_tree(parsed("tmp_ivl_21(4 downto 2)", "term"))
+    'tmp_ivl_21 ( 4 downto 2 )'
+    """
+    # Single pre-order pass and join, rather than joining at every internal node.
+    terminal_texts = []
+    remaining_nodes = [parse_tree]
+    while remaining_nodes:
+        node = remaining_nodes.pop()
+        if node.text is not None:
+            terminal_texts.append(node.text)
+        else:
+            remaining_nodes.extend(reversed(node.children))
+
+    return " ".join(terminal_texts)
 
 
 def parse_tree_query(func):
@@ -171,26 +289,31 @@ def parse_tree_query(func):
     ...     return parse_tree.text
     """
 
+    node_type_visitor_func: dict[str, Callable] = {}
+
     @wraps(func)
     def wrapper(parse_tree: ParseTree | None, *args, **kwargs) -> Any | None:
         if parse_tree is None:
             return None
 
-        children_query_results = [
-            wrapper(child, *args, **kwargs) for child in parse_tree.children
-        ]
-        node_type_func = func.node_type_visitor_func.get(parse_tree.node_type, func)
+        # Bind the dispatch table and query arguments once per query, rather than
+        # repacking *args / **kwargs and re-checking for None at every node.
+        # Children are never None, so the recursion skips that check entirely.
+        visitor_func_for = node_type_visitor_func.get
 
-        return node_type_func(
-            parse_tree,
-            children_query_results,
-            *args,
-            **kwargs,
-        )
+        def visit(node: ParseTree) -> Any:
+            return visitor_func_for(node.node_type, func)(
+                node,
+                [visit(child) for child in node.children],
+                *args,
+                **kwargs,
+            )
+
+        return visit(parse_tree)
 
     def wrapper_register(node_type: str):
         def wrapped_register(visitor_func):
-            func.node_type_visitor_func[node_type] = visitor_func
+            node_type_visitor_func[node_type] = visitor_func
             visitor_func.register = wrapper_register
 
             return visitor_func
@@ -198,7 +321,7 @@ def parse_tree_query(func):
         return wrapped_register
 
     wrapper.register = wrapper_register
-    func.node_type_visitor_func = {}
+    func.node_type_visitor_func = node_type_visitor_func
 
     return wrapper
 
@@ -248,33 +371,42 @@ def next_child(
             return children[step]
 
     elif isinstance(step, str):
-        matching_children = [
-            child for child in children if child is not None if child.node_type == step
-        ]
+        return _only_child(
+            [child for child in children if child.node_type == step],
+            step,
+            raise_on_ambiguous,
+        )
 
-        if len(matching_children) == 0:
-            return None
-        elif len(matching_children) == 1:
-            return matching_children[0]
-        else:
-            if raise_on_ambiguous:
-                raise ValueError(
-                    f"Multiple children have node type {step}, expected only one."
-                )
-            else:
-                return None
     else:
         raise ValueError(
             f"Path steps are either indices (ints) or node_types (str). Got {step}."
         )
 
 
+def _only_child(
+    matching_children: list[ParseTree],
+    node_type: str,
+    raise_on_ambiguous: bool,
+) -> ParseTree | None:
+    if len(matching_children) == 0:
+        return None
+    elif len(matching_children) == 1:
+        return matching_children[0]
+    else:
+        if raise_on_ambiguous:
+            raise ValueError(
+                f"Multiple children have node type {node_type}, expected only one."
+            )
+        else:
+            return None
+
+
 def children_of_type(
     node: ParseTree,
     children_types: str | set[str],
 ) -> list[ParseTree]:
     if isinstance(children_types, str):
-        acceptable_node_types = {children_types}
+        return list(node.children_by_type.get(children_types, []))
     elif isinstance(children_types, set):
         acceptable_node_types = children_types
     else:
@@ -292,23 +424,87 @@ def parse_tree_get(
     *path: int | str,
     raise_on_ambiguous: bool = False,
 ) -> ParseTree | None:
-    if parse_tree is None:
-        return None
+    for step in path:
+        if parse_tree is None or len(parse_tree.children) == 0:
+            return None
 
-    if len(path) == 0:
-        return parse_tree
+        if isinstance(step, str):
+            parse_tree = _only_child(
+                parse_tree.children_by_type.get(step, []), step, raise_on_ambiguous
+            )
+        else:
+            parse_tree = next_child(
+                parse_tree.children, step, raise_on_ambiguous=raise_on_ambiguous
+            )
 
-    if len(parse_tree.children) == 0:
-        return None
+    return parse_tree
 
-    next_step, *remaining_path = path
 
-    return parse_tree_get(
-        next_child(
-            parse_tree.children, next_step, raise_on_ambiguous=raise_on_ambiguous
-        ),
-        *remaining_path,
-    )
+# Path with its steps pre-sorted into indices (True, int) and node_types (False, str).
+CompiledPath = tuple[tuple[bool, int | str], ...]
+
+
+@cache
+def compile_path(*path: int | str) -> CompiledPath:
+    """
+    Validate and resolve a parse_tree_get() path once, so frequently used paths
+    don't pay for per-step type dispatch on every lookup.
+
+    >>> compile_path("term", "factor", 0)
+    ((False, 'term'), (False, 'factor'), (True, 0))
+
+    >>> compile_path("term", 1.5)
+    Traceback (most recent call last):
+      ...
+    ValueError: Path steps are either indices (ints) or node_types (str). Got 1.5.
+    """
+    compiled_steps = []
+    for step in path:
+        if not isinstance(step, (int, str)):
+            raise ValueError(
+                f"Path steps are either indices (ints) or node_types (str). Got {step}."
+            )
+        compiled_steps.append((isinstance(step, int), step))
+
+    return tuple(compiled_steps)
+
+
+def parse_tree_get_compiled(
+    parse_tree: ParseTree | None,
+    path: CompiledPath,
+    raise_on_ambiguous: bool = False,
+) -> ParseTree | None:
+    """
+    parse_tree_get(), but for paths produced by compile_path().
+
+    >>> node = parsed("tmp_ivl_21(2)", "term")
+    >>> path = compile_path("factor", "primary", "name", "identifier", 0)
+    >>> parse_tree_get_compiled(node, path)
+    ParseTree(node_type='TMP_IVL_21', children=[], text='tmp_ivl_21')
+
+    Like parse_tree_get(), any step from a childless node finds nothing:
+
+    >>> leaf = parse_tree_get_compiled(node, path)
+    >>> parse_tree_get_compiled(leaf, compile_path(-1)) is None
+    True
+    >>> parse_tree_get(leaf, -1) is None
+    True
+    """
+    for is_index, step in path:
+        children = parse_tree.children if parse_tree is not None else None
+        if not children:
+            return None
+
+        if is_index:
+            assert isinstance(step, int)  # For MyPy.
+            parse_tree = children[step] if step < len(children) else None
+        else:
+            assert isinstance(step, str)  # For MyPy.
+            parse_tree = _only_child(
+                parse_tree.children_by_type.get(step, []), step, raise_on_ambiguous
+            )
+
+    return parse_tree
 
 
 def parse_tree_assert_get(parse_tree: ParseTree, *path: int | str) -> ParseTree:
@@ -74,11 +74,13 @@ True
 """
 
 from abc import ABCMeta, abstractmethod
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from dataclasses import dataclass
-from functools import cache, cached_property
+from functools import cached_property
+from itertools import product
 from pprint import pformat
 from random import randint
+import sys
 from typing import (
     Any,
     Literal,
@@ -89,23 +91,28 @@ from typing import (
     overload,
 )
 
+import numpy as np
+
+from redhdl.misc.caching import weak_id_cached
 from redhdl.misc.slice import Slice
 
 Axis = Literal["x", "y", "z"]
 axes = cast(list[Axis], ["x", "y", "z"])
 X_AXIS_INDEX, Y_AXIS_INDEX, Z_AXIS_INDEX = 0, 1, 2
+_axes_set = frozenset(axes)
 
 
 def is_axis(axis: str) -> TypeGuard[Axis]:
-    return axis in axes
+    return axis in _axes_set
 
 
 Direction = Literal["up", "down", "north", "east", "south", "west"]
 directions: list[Direction] = ["up", "down", "north", "east", "south", "west"]
+_directions_set = frozenset(directions)
 
 
 def is_direction(value: str) -> TypeGuard[Direction]:
-    return value in directions
+    return value in _directions_set
 
 
 xz_directions: list[Direction] = [
@@ -225,13 +232,19 @@ class Pos(NamedTuple):
 
         assert isinstance(divisor, Pos)
 
-        if not all((a == b == 0) or ((a % b) == 0) for a, b in zip(self, divisor)):
+        sx, sy, sz = self
+        dx, dy, dz = divisor
+        if not (
+            (sx == dx == 0 or sx % dx == 0)
+            and (sy == dy == 0 or sy % dy == 0)
+            and (sz == dz == 0 or sz % dz == 0)
+        ):
             raise ValueError(f"Position {self} doesn't divide cleanly by {divisor}.")
 
         return Pos(
-            0 if self.x == divisor.x == 0 else self.x // divisor.x,
-            0 if self.y == divisor.y == 0 else self.y // divisor.y,
-            0 if self.z == divisor.z == 0 else self.z // divisor.z,
+            0 if sx == dx == 0 else sx // dx,
+            0 if sy == dy == 0 else sy // dy,
+            0 if sz == dz == 0 else sz // dz,
         )
 
     def __mod__(self, value) -> "Pos":
@@ -264,9 +277,23 @@ class Pos(NamedTuple):
 
     @classmethod
     def elem_min(cls, *points: "Pos") -> "Pos":
+        """
+        >>> Pos.elem_min(Pos(1, 5, -2), Pos(3, 0, -2))
+        Pos(1, 0, -2)
+        >>> Pos.elem_max(Pos(1, 5, -2), Pos(3, 0, -2), Pos(0, 0, 7))
+        Pos(3, 5, 7)
+        """
         if not points:
             raise ValueError("Cannot find min element of empty set.")
 
+        if len(points) == 2:
+            (ax, ay, az), (bx, by, bz) = points
+            return cls(
+                ax if ax < bx else bx,
+                ay if ay < by else by,
+                az if az < bz else bz,
+            )
+
         xs, ys, zs = zip(*points)
         return cls(min(xs), min(ys), min(zs))
 
@@ -275,19 +302,63 @@ class Pos(NamedTuple):
         if not points:
             raise ValueError("Cannot find min element of empty set.")
 
+        if len(points) == 2:
+            (ax, ay, az), (bx, by, bz) = points
+            return cls(
+                ax if ax > bx else bx,
+                ay if ay > by else by,
+                az if az > bz else bz,
+            )
+
         xs, ys, zs = zip(*points)
         return cls(max(xs), max(ys), max(zs))
 
+    @classmethod
+    def elem_min_iter(cls, points: Iterable["Pos"]) -> "Pos":
+        """
+        elem_min over any iterable of points, without *-unpacking it.
+
+        >>> Pos.elem_min_iter(Pos(x, 5 - x, 2) for x in range(4))
+        Pos(0, 2, 2)
+        >>> Pos.elem_max_iter(Pos(x, 5 - x, 2) for x in range(4))
+        Pos(3, 5, 2)
+        """
+        point_iter = iter(points)
+        try:
+            min_x, min_y, min_z = next(point_iter)
+        except StopIteration:
+            raise ValueError("Cannot find min element of empty set.") from None
+
+        for x, y, z in point_iter:
+            if x < min_x:
+                min_x = x
+            if y < min_y:
+                min_y = y
+            if z < min_z:
+                min_z = z
+
+        return cls(min_x, min_y, min_z)
+
+    @classmethod
+    def elem_max_iter(cls, points: Iterable["Pos"]) -> "Pos":
+        point_iter = iter(points)
+        try:
+            max_x, max_y, max_z = next(point_iter)
+        except StopIteration:
+            raise ValueError("Cannot find max element of empty set.") from None
+
+        for x, y, z in point_iter:
+            if x > max_x:
+                max_x = x
+            if y > max_y:
+                max_y = y
+            if z > max_z:
+                max_z = z
+
+        return cls(max_x, max_y, max_z)
+
     def y_rotated(self, quarter_turns: int) -> "Pos":
-        x, y, z = self
-        return Pos(
-            *[
-                [x, y, z],
-                [z, y, -x],
-                [-x, y, -z],
-                [-z, y, x],
-            ][quarter_turns % 4]
-        )
+        return _Y_ROT[quarter_turns % 4](*self)
 
     def is_zero(self) -> bool:
         return self == zero_pos
@@ -316,21 +387,51 @@ class Pos(NamedTuple):
     def __repr__(self: "Pos") -> str:
         return str(self)
 
+    @classmethod
+    def get(cls, x: int, y: int, z: int) -> "Pos":
+        """
+        Pos(x, y, z), reusing a shared instance for small offsets near the origin.
+
+        >>> Pos.get(1, 0, -1) is Pos.get(1, 0, -1)
+        True
+        >>> Pos.get(10, 0, 0)
+        Pos(10, 0, 0)
+        """
+        return _POS_CACHE.get((x, y, z)) or cls(x, y, z)
 
-zero_pos = Pos(0, 0, 0)
+
+# Shared instances of commonly used small positions (unit vectors, paddings, etc.)
+_POS_CACHE: dict[tuple[int, int, int], Pos] = {
+    (x, y, z): Pos(x, y, z)
+    for x in range(-2, 3)
+    for y in range(-2, 3)
+    for z in range(-2, 3)
+}
+
+# Pos.y_rotated() for each quarter turn.
+_Y_ROT: tuple[Callable[[int, int, int], Pos], ...] = (
+    lambda x, y, z: Pos(x, y, z),
+    lambda x, y, z: Pos(z, y, -x),
+    lambda x, y, z: Pos(-x, y, -z),
+    lambda x, y, z: Pos(-z, y, x),
+)
+
+zero_pos = Pos.get(0, 0, 0)
 
 
 direction_unit_pos = {
-    "west": Pos(-1, 0, 0),
-    "down": Pos(0, -1, 0),
-    "north": Pos(0, 0, -1),
-    "east": Pos(1, 0, 0),
-    "up": Pos(0, 1, 0),
-    "south": Pos(0, 0, 1),
+    "west": Pos.get(-1, 0, 0),
+    "down": Pos.get(0, -1, 0),
+    "north": Pos.get(0, 0, -1),
+    "east": Pos.get(1, 0, 0),
+    "up": Pos.get(0, 1, 0),
+    "south": Pos.get(0, 0, 1),
 }
 
 unit_pos_direction = {pos: direction for direction, pos in direction_unit_pos.items()}
 
+axis_unit_poses = (Pos.get(1, 0, 0), Pos.get(0, 1, 0), Pos.get(0, 0, 1))
+
 
 def random_pos(inclusive_max_pos: Pos) -> Pos:
     return Pos(
@@ -353,6 +454,12 @@ class PositionSequence:
     >>> list(PositionSequence(Pos(-1, -1, 1), Pos(-5, -5, -3), count=3))
     [Pos(-1, -1, 1), Pos(-3, -3, -1), Pos(-5, -5, -3)]
 
+    >>> seq = PositionSequence(Pos(0, 0, 0), Pos(0, 0, 12), count=7)
+    >>> seq[1], seq[-1]
+    (Pos(0, 0, 2), Pos(0, 0, 12))
+    >>> seq & Slice(1, 6, 2)
+    PositionSequence(Pos(0, 0, 2), Pos(0, 0, 10), count=3)
+
 
     Start, step, and stop must _cleanly_ align into each other:
     >>> PositionSequence(Pos(0, 0, 0), Pos(3, 2, 1), count=3)
@@ -436,13 +543,12 @@ class PositionSequence:
 
         assert isinstance(other, Slice)  # For MyPy.
 
-        desired_indices = list(other.values())
-
-        positions = self.values()
+        # A range() indexes and measures in O(1), so nothing is materialized.
+        desired_indices = range(other.start, other.stop, other.step)
 
         return PositionSequence(
-            start=positions[desired_indices[0]],
-            stop=positions[desired_indices[-1]],
+            start=self[desired_indices[0]],
+            stop=self[desired_indices[-1]],
             count=len(desired_indices),
         )
 
@@ -452,15 +558,23 @@ class PositionSequence:
                 f"PositionSequence.__getitem__() expected integer index, not value {index}."
             )
 
-        return list(self)[index]
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(f"PositionSequence index {index} out of range.")
 
-    def __iter__(self) -> Iterator[Pos]:
-        step = self.step
+        return self.start + self.step * index
+
+    @cached_property
+    def _values_arr(self) -> np.ndarray:
+        """(count, 3) array of the sequence's positions."""
+        step_indices = np.arange(self.count, dtype=np.int64)[:, None]
+        return np.array(self.start, dtype=np.int64) + step_indices * np.array(
+            self.step, dtype=np.int64
+        )
 
-        curr_pos = self.start
-        for _step_index in range(self.count):
-            yield curr_pos
-            curr_pos += step
+    def __iter__(self) -> Iterator[Pos]:
+        return map(Pos._make, self._values_arr.tolist())
 
     def __len__(self) -> int:
         return self.count
@@ -472,6 +586,114 @@ class PositionSequence:
         return f"PositionSequence({self.start}, {self.stop}, count={self.count})"
 
 
+# Positions packed into a single int, one 32-bit slot per axis, each biased to be
+# non-negative. Comparing every axis at once is then one subtraction: the top
+# (guard) bit of each slot survives `(right | guards) - left` iff that axis of right
+# is >= that of left, and no slot ever borrows from its neighbor.
+# Coordinates must lie within +/- 2**30.
+_PACK_BIAS = 1 << 30
+_PACK_GUARDS = (1 << 95) | (1 << 63) | (1 << 31)
+
+
+def _packed(pos: Pos) -> int:
+    return (
+        ((pos.x + _PACK_BIAS) << 64)
+        | ((pos.y + _PACK_BIAS) << 32)
+        | (pos.z + _PACK_BIAS)
+    )
+
+
+def _packed_le(left: int, right: int) -> bool:
+    """
+    Packed equivalent of `left <= right` (on every axis).
+
+    >>> _packed_le(_packed(Pos(-5, 0, 3)), _packed(Pos(-5, 2, 4)))
+    True
+    >>> _packed_le(_packed(Pos(-5, 0, 3)), _packed(Pos(-6, 2, 4)))
+    False
+    """
+    return ((right | _PACK_GUARDS) - left) & _PACK_GUARDS == _PACK_GUARDS
+
+
+def _aabbs_overlap(left: "Region", right: "Region") -> bool:
+    return _packed_le(left._packed_min, right._packed_max) and _packed_le(
+        right._packed_min, left._packed_max
+    )
+
+
+# At or above this many regions, CompositeRegion and any_overlap() index their
+# regions with a _BVHNode tree instead of scanning them linearly.
+_BVH_MIN_REGIONS = 8
+_BVH_LEAF_SIZE = 4
+
+
+@dataclass(frozen=True, slots=True)
+class _BVHNode:
+    """
+    Bounding volume hierarchy over the AABBs of a sequence of regions.
+
+    Leaves hold (up to _BVH_LEAF_SIZE) region indices; inner nodes split their
+    regions in half at the median of their bounds' longest axis.
+
+    >>> regions = [RectangularPrism(Pos(i, 0, 0), Pos(i, 0, 0)) for i in range(20)]
+    >>> bvh = _BVHNode.build(regions)
+
+    Candidates come a leaf at a time; the rest of the tree is pruned:
+    >>> sorted(bvh.overlapping(_packed(Pos(5, 0, 0)), _packed(Pos(7, 0, 0))))
+    [5, 6, 7, 8, 9]
+    """
+
+    packed_min: int
+    packed_max: int
+    indices: tuple[int, ...]
+    children: tuple["_BVHNode", ...]
+
+    @classmethod
+    def build(
+        cls, regions: Sequence["Region"], indices: list[int] | None = None
+    ) -> "_BVHNode":
+        if indices is None:
+            indices = list(range(len(regions)))
+
+        min_pos = Pos.elem_min(*(regions[index].min_pos for index in indices))
+        max_pos = Pos.elem_max(*(regions[index].max_pos for index in indices))
+
+        if len(indices) <= _BVH_LEAF_SIZE:
+            return cls(_packed(min_pos), _packed(max_pos), tuple(indices), ())
+
+        axis = max(range(3), key=lambda axis: max_pos[axis] - min_pos[axis])
+        indices = sorted(
+            indices,
+            key=lambda index: (
+                regions[index].min_pos[axis] + regions[index].max_pos[axis]
+            ),
+        )
+        split = len(indices) // 2
+
+        return cls(
+            _packed(min_pos),
+            _packed(max_pos),
+            (),
+            (cls.build(regions, indices[:split]), cls.build(regions, indices[split:])),
+        )
+
+    def overlapping(self, packed_min: int, packed_max: int) -> Iterator[int]:
+        """
+        Indices of the regions in leaves whose AABB overlaps the given (packed) AABB.
+        Regions' own AABBs aren't checked.
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if _packed_le(node.packed_min, packed_max) and _packed_le(
+                packed_min, node.packed_max
+            ):
+                if node.children:
+                    stack.extend(node.children)
+                else:
+                    yield from node.indices
+
+
 class Region(metaclass=ABCMeta):
     min_pos: Pos
     max_pos: Pos
@@ -497,7 +719,7 @@ class Region(metaclass=ABCMeta):
         pass
 
     def __len__(self) -> int:
-        return len(list(self))
+        return len(self.points)
 
     @abstractmethod
     def __iter__(self) -> Iterator[Pos]:
@@ -519,6 +741,14 @@ class Region(metaclass=ABCMeta):
     def intersects(self, other: "Region") -> bool:
         return not (self & other).is_empty()
 
+    @cached_property
+    def _packed_min(self) -> int:
+        return _packed(self.min_pos)
+
+    @cached_property
+    def _packed_max(self) -> int:
+        return _packed(self.max_pos)
+
     def bounding_rect(self) -> "RectangularPrism":
         return RectangularPrism(
             min_pos=self.min_pos,
@@ -526,15 +756,47 @@ class Region(metaclass=ABCMeta):
         )
 
 
+# Below this many points, PointRegion sticks to plain set operations; numpy's
+# per-call overhead outweighs the vectorization.
+_POINT_REGION_ARRAY_MIN_POINTS = 256
+
+# Quarter turn rotation matrices, for rotating (N, 3) arrays of row positions with
+# `positions @ _Y_ROTATIONS[quarter_turns]`. Row i is unit vector i, rotated.
+_Y_ROTATIONS = np.array(
+    [
+        [unit_pos.y_rotated(quarter_turns) for unit_pos in axis_unit_poses]
+        for quarter_turns in range(4)
+    ],
+    dtype=np.int32,
+)
+
+
 @dataclass(frozen=True)
 class PointRegion(Region):
     points: frozenset[Pos]
 
+    @cached_property
+    def _arr(self) -> np.ndarray:
+        """
+        Points as an (N, 3) int32 array; used for bulk operations on large regions.
+        """
+        return np.array(tuple(self.points), dtype=np.int32).reshape(-1, 3)
+
+    @classmethod
+    def _from_arr(cls, arr: np.ndarray) -> "PointRegion":
+        return cls(frozenset(map(Pos._make, arr.tolist())))
+
+    def _use_arr(self) -> bool:
+        return len(self.points) >= _POINT_REGION_ARRAY_MIN_POINTS
+
     @cached_property
     def min_pos(self) -> Pos:  # type: ignore
         if not self.points:
             return zero_pos
 
+        if self._use_arr():
+            return Pos._make(self._arr.min(axis=0).tolist())
+
         return Pos.elem_min(*self.points)
 
     @cached_property
@@ -542,9 +804,15 @@ class PointRegion(Region):
         if not self.points:
             return zero_pos
 
+        if self._use_arr():
+            return Pos._make(self._arr.max(axis=0).tolist())
+
         return Pos.elem_max(*self.points)
 
     def shifted(self, offset: Pos) -> Region:
+        if self._use_arr():
+            return PointRegion._from_arr(self._arr + np.array(offset, dtype=np.int32))
+
         return PointRegion(frozenset(point + offset for point in self.points))
 
     def xz_padded(self, padding_blocks: int = 1) -> Region:
@@ -556,17 +824,40 @@ class PointRegion(Region):
         False
         >>> Pos(3, 0, 2) in region
         False
+
+        Large regions take the array path, with the same results:
+        >>> line = RectangularPrism(Pos(0, 0, 0), Pos(0, 0, 999))
+        >>> PointRegion(line.points).xz_padded(1) == PointRegion(
+        ...     RectangularPrism(Pos(-1, 0, -1), Pos(1, 0, 1000)).points
+        ... )
+        True
         """
+        padding_offsets = [
+            Pos.get(dx, 0, dz)
+            for dx in range(-padding_blocks, padding_blocks + 1)
+            for dz in range(-padding_blocks, padding_blocks + 1)
+        ]
+        if self._use_arr():
+            offsets_arr = np.array(padding_offsets, dtype=np.int32)
+            return PointRegion._from_arr(
+                (self._arr[:, None, :] + offsets_arr[None, :, :]).reshape(-1, 3)
+            )
+
         return PointRegion(
             frozenset(
-                point + Pos(dx, 0, dz)
-                for point in self.points
-                for dx in range(-padding_blocks, padding_blocks + 1)
-                for dz in range(-padding_blocks, padding_blocks + 1)
+                point + offset for point in self.points for offset in padding_offsets
             )
         )
 
     def y_rotated(self, quarter_turns: int) -> Region:
+        """
+        >>> line = PointRegion(RectangularPrism(Pos(1, 2, 3), Pos(1, 2, 999)).points)
+        >>> line.y_rotated(1) == PointRegion(frozenset(point.y_rotated(1) for point in line.points))
+        True
+        """
+        if self._use_arr():
+            return PointRegion._from_arr(self._arr @ _Y_ROTATIONS[quarter_turns % 4])
+
         return PointRegion(
             frozenset(point.y_rotated(quarter_turns) for point in self.points)
         )
@@ -582,11 +873,17 @@ class PointRegion(Region):
 
     def __and__(self, other: Region) -> Any:
         # Fast AABB check.
-        if not (self.min_pos <= other.max_pos and self.max_pos >= other.min_pos):
+        if not _aabbs_overlap(self, other):
             return PointRegion(frozenset())
 
         if isinstance(other, PointRegion):
             return PointRegion(self.points & other.points)
+        elif isinstance(other, RectangularPrism) and self._use_arr():
+            arr = self._arr
+            in_prism = (
+                (arr >= np.array(other.min_pos)) & (arr <= np.array(other.max_pos))
+            ).all(axis=1)
+            return PointRegion._from_arr(arr[in_prism])
         elif isinstance(other, (RectangularPrism, CompositeRegion)):
             return PointRegion(
                 frozenset(point for point in self.points if point in other)
@@ -614,11 +911,10 @@ class PointRegion(Region):
     def __ror__(self, other: Region) -> Any:
         return self.__or__(other)
 
-    # TODO: Replace memory leaking @cache with id()-based caching.
-    @cache  # noqa: B019
+    @weak_id_cached
     def intersects(self, other: "Region") -> bool:
         # Fast AABB check.
-        if not (self.min_pos <= other.max_pos and self.max_pos >= other.min_pos):
+        if not _aabbs_overlap(self, other):
             return False
 
         if isinstance(other, PointRegion):
@@ -676,26 +972,65 @@ class RectangularPrism(Region):
             max_pos=Pos.elem_max(a, b),
         )
 
+    @cached_property
+    def _volume(self) -> int:
+        min_pos, max_pos = self.min_pos, self.max_pos
+        width = max_pos.x - min_pos.x + 1
+        height = max_pos.y - min_pos.y + 1
+        depth = max_pos.z - min_pos.z + 1
+        if width <= 0 or height <= 0 or depth <= 0:
+            return 0
+
+        return width * height * depth
+
     def __len__(self) -> int:
         """
         >>> len(RectangularPrism(Pos(0, 0, 0), Pos(1, 1, 1)))
         8
+
+        Empty (inverted) prisms have no blocks:
+        >>> len(RectangularPrism(Pos(0, 0, 0), Pos(-1, -1, 1)))
+        0
         """
-        width, height, depth = self.max_pos - self.min_pos + Pos(1, 1, 1)
-        return width * height * depth
+        return self._volume
+
+    def coords_array(self) -> np.ndarray:
+        """
+        Every point in the prism as an (N, 3) array, in x-major, z-minor order.
+
+        >>> RectangularPrism(Pos(0, 0, 0), Pos(1, 0, 1)).coords_array().tolist()
+        [[0, 0, 0], [0, 0, 1], [1, 0, 0], [1, 0, 1]]
+        """
+        xs, ys, zs = np.meshgrid(
+            np.arange(self.min_pos.x, self.max_pos.x + 1),
+            np.arange(self.min_pos.y, self.max_pos.y + 1),
+            np.arange(self.min_pos.z, self.max_pos.z + 1),
+            indexing="ij",
+        )
+        return np.stack([xs.ravel(), ys.ravel(), zs.ravel()], axis=1)
 
     def __iter__(self) -> Iterator[Pos]:
-        for x in range(self.min_pos.x, self.max_pos.x + 1):
-            for y in range(self.min_pos.y, self.max_pos.y + 1):
-                for z in range(self.min_pos.z, self.max_pos.z + 1):
-                    yield Pos(x, y, z)
+        """
+        >>> list(RectangularPrism(Pos(0, 0, 0), Pos(1, 0, 1)))
+        [Pos(0, 0, 0), Pos(0, 0, 1), Pos(1, 0, 0), Pos(1, 0, 1)]
+        """
+        min_x, min_y, min_z = self.min_pos
+        max_x, max_y, max_z = self.max_pos
+        return map(
+            Pos._make,
+            product(
+                range(min_x, max_x + 1),
+                range(min_y, max_y + 1),
+                range(min_z, max_z + 1),
+            ),
+        )
 
     def __contains__(self, point: Pos) -> bool:
         return self.min_pos <= point <= self.max_pos
 
     def __and__(self, other: Region) -> Any:
         # Fast AABB check.
-        if not (self.min_pos <= other.max_pos and self.max_pos >= other.min_pos):
+        if not _aabbs_overlap(self, other):
             return PointRegion(frozenset())
 
         if isinstance(other, RectangularPrism):
@@ -724,11 +1059,10 @@ class RectangularPrism(Region):
     def is_empty(self) -> bool:
         return not (self.min_pos <= self.max_pos)
 
-    # TODO: Replace memory leaking @cache with id()-based caching.
-    @cache  # noqa: B019
+    @weak_id_cached
     def intersects(self, other: "Region") -> bool:
         # Fast AABB check.
-        if not (self.min_pos <= other.max_pos and self.max_pos >= other.min_pos):
+        if not _aabbs_overlap(self, other):
             return False
 
         if isinstance(other, PointRegion):
@@ -745,6 +1079,74 @@ class RectangularPrism(Region):
         return str(self)
 
 
+# Below this many subregion pairs, CompositeRegion & CompositeRegion tests each
+# pair's AABB in Python rather than prefiltering them with numpy.
+_COMPOSITE_AND_ARRAY_MIN_PAIRS = 64
+
+# Largest compressed grid _prisms_union_volume() will allocate, in cells.
+_PRISMS_UNION_MAX_CELLS = 1 << 24
+
+
+def _prisms_union_volume(prisms: tuple[RectangularPrism, ...]) -> int | None:
+    """
+    Volume of the union of a set of prisms, or None if there are too many to
+    compute it this way.
+
+    Compresses each axis down to the prisms' boundaries, marks the covered cells
+    of the resulting (non-uniform) grid, and sums the covered cells' volumes.
+
+    >>> _prisms_union_volume(
+    ...     (
+    ...         RectangularPrism(Pos(0, 0, 0), Pos(2, 2, 2)),
+    ...         RectangularPrism(Pos(1, 1, 1), Pos(3, 3, 3)),
+    ...         RectangularPrism(Pos(9, 9, 9), Pos(8, 8, 8)),
+    ...     )
+    ... )
+    46
+    """
+    prisms = tuple(prism for prism in prisms if not prism.is_empty())
+    if not prisms:
+        return 0
+
+    starts = np.array([prism.min_pos for prism in prisms], dtype=np.int64)
+    ends = np.array([prism.max_pos for prism in prisms], dtype=np.int64) + 1
+
+    axis_boundaries = [
+        np.unique(np.concatenate([starts[:, axis], ends[:, axis]])) for axis in range(3)
+    ]
+    grid_shape = tuple(len(boundaries) - 1 for boundaries in axis_boundaries)
+    if grid_shape[0] * grid_shape[1] * grid_shape[2] > _PRISMS_UNION_MAX_CELLS:
+        return None
+
+    start_cells = np.stack(
+        [
+            np.searchsorted(boundaries, starts[:, axis])
+            for axis, boundaries in enumerate(axis_boundaries)
+        ],
+        axis=1,
+    ).tolist()
+    end_cells = np.stack(
+        [
+            np.searchsorted(boundaries, ends[:, axis])
+            for axis, boundaries in enumerate(axis_boundaries)
+        ],
+        axis=1,
+    ).tolist()
+
+    covered = np.zeros(grid_shape, dtype=np.bool_)
+    for (x0, y0, z0), (x1, y1, z1) in zip(start_cells, end_cells, strict=True):
+        covered[x0:x1, y0:y1, z0:z1] = True
+
+    x_widths, y_widths, z_widths = (
+        np.diff(boundaries) for boundaries in axis_boundaries
+    )
+    # einsum casts the boolean grid in small buffers; matmul would first copy the
+    # whole grid to int64 (8x the grid's size).
+    return int(
+        np.einsum("xyz,x,y,z->", covered, x_widths, y_widths, z_widths, dtype=np.int64)
+    )
+
+
 @dataclass(frozen=True)
 class CompositeRegion(Region):
     """
@@ -756,10 +1158,28 @@ class CompositeRegion(Region):
 
     @cached_property
     def min_pos(self) -> Pos:  # type: ignore
+        if not self.subregions:
+            return zero_pos
+        elif len(self.subregions) == 1:
+            return self.subregions[0].min_pos
+        elif len(self.subregions) == 2:
+            # Binary unions (from __or__) are common; use the unrolled path.
+            left, right = self.subregions
+            return Pos.elem_min(left.min_pos, right.min_pos)
+
         return Pos.elem_min(*(region.min_pos for region in self.subregions))
 
     @cached_property
     def max_pos(self) -> Pos:  # type: ignore
+        if not self.subregions:
+            return zero_pos
+        elif len(self.subregions) == 1:
+            return self.subregions[0].max_pos
+        elif len(self.subregions) == 2:
+            # Binary unions (from __or__) are common; use the unrolled path.
+            left, right = self.subregions
+            return Pos.elem_max(left.max_pos, right.max_pos)
+
         return Pos.elem_max(*(region.max_pos for region in self.subregions))
 
     def shifted(self, offset: Pos) -> Region:
@@ -779,14 +1199,34 @@ class CompositeRegion(Region):
             )
         )
 
-    # TODO: Replace memory leaking @cache with id()-based caching.
-    @cache  # noqa: B019
+    @weak_id_cached
     def __len__(self) -> int:
         """
         The area taken by a set of overlapping regions is a hard problem.
 
-        This method will not scale gracefully to large numbers of subregions.
+        This method will not scale gracefully to large numbers of subregions,
+        except for composites of only RectangularPrisms, which have a fast path.
+
+        >>> len(
+        ...     CompositeRegion(
+        ...         (
+        ...             RectangularPrism(Pos(0, 0, 0), Pos(2, 2, 2)),
+        ...             RectangularPrism(Pos(1, 1, 1), Pos(3, 3, 3)),
+        ...             PointRegion(frozenset({Pos(3, 3, 3), Pos(4, 4, 4)})),
+        ...         )
+        ...     )
+        ... )
+        47
         """
+        if all(
+            isinstance(subregion, RectangularPrism) for subregion in self.subregions
+        ):
+            volume = _prisms_union_volume(
+                cast(tuple[RectangularPrism, ...], self.subregions)
+            )
+            if volume is not None:
+                return volume
+
         block_count = 0
         counted_regions = CompositeRegion(tuple())  # noqa: C408
         for subregion in self.subregions:
@@ -798,11 +1238,29 @@ class CompositeRegion(Region):
         return block_count
 
     def __iter__(self) -> Iterator[Pos]:
-        return iter({point for region in self.subregions for point in region})
+        return iter(self.points)
 
     def __contains__(self, point: Pos) -> bool:
+        """
+        Like every Region, accepts plain (x, y, z) tuples at any composite size.
+
+        >>> lines = CompositeRegion(tuple(RectangularPrism(Pos(0, 0, z), Pos(3, 0, z)) for z in range(10)))
+        >>> (2, 0, 7) in lines, Pos(2, 0, 7) in lines, (4, 0, 7) in lines
+        (True, True, False)
+        """
+        if len(self.subregions) >= _BVH_MIN_REGIONS:
+            packed_point = _packed(Pos._make(point))
+            return any(
+                point in self.subregions[index]
+                for index in self._bvh.overlapping(packed_point, packed_point)
+            )
+
         return any(point in region for region in self.subregions)
 
+    @cached_property
+    def _bvh(self) -> _BVHNode:
+        return _BVHNode.build(self.subregions)
+
     def __or__(self, other: Region) -> Any:
         if isinstance(other, CompositeRegion):
             return CompositeRegion(
@@ -818,10 +1276,15 @@ class CompositeRegion(Region):
 
     def __and__(self, other: Region) -> Any:
         # Fast AABB check.
-        if not (self.min_pos <= other.max_pos and self.max_pos >= other.min_pos):
+        if not _aabbs_overlap(self, other):
             return PointRegion(frozenset())
 
-        if isinstance(other, CompositeRegion):
+        if isinstance(other, CompositeRegion) and (
+            len(self.subregions) * len(other.subregions)
+            >= _COMPOSITE_AND_ARRAY_MIN_PAIRS
+        ):
+            regions = self._pairwise_intersections(other)
+        elif isinstance(other, CompositeRegion):
             # When combining composite regions, flatten.
             regions = [
                 combined_region
@@ -841,25 +1304,85 @@ class CompositeRegion(Region):
     def __rand__(self, other: Region) -> Any:
         return self.__and__(other)
 
+    @cached_property
+    def _bounds_arrs(self) -> tuple[np.ndarray, np.ndarray]:
+        """(N, 3) arrays of every subregion's min_pos and max_pos."""
+        return (
+            np.array([region.min_pos for region in self.subregions], dtype=np.int64),
+            np.array([region.max_pos for region in self.subregions], dtype=np.int64),
+        )
+
+    @cached_property
+    def _all_prisms(self) -> bool:
+        return all(isinstance(region, RectangularPrism) for region in self.subregions)
+
+    def _pairwise_intersections(self, other: "CompositeRegion") -> list[Region]:
+        """
+        Non-empty intersections of every pair of subregions, with the pairs' AABBs
+        tested all at once.
+
+        >>> left = CompositeRegion(tuple(RectangularPrism(Pos(i, 0, 0), Pos(i, 0, 0)) for i in range(10)))
+        >>> right = CompositeRegion(
+        ...     tuple(RectangularPrism(Pos(i, 0, 0), Pos(i + 1, 0, 0)) for i in range(8, 16))
+        ... )
+        >>> [(region.min_pos.x, region.max_pos.x) for region in left._pairwise_intersections(right)]
+        [(8, 8), (9, 9), (9, 9)]
+        """
+        self_mins, self_maxs = self._bounds_arrs
+        other_mins, other_maxs = other._bounds_arrs
+
+        overlaps = (self_mins[:, None] <= other_maxs[None, :]).all(axis=-1) & (
+            other_mins[None, :] <= self_maxs[:, None]
+        ).all(axis=-1)
+        self_indices, other_indices = np.nonzero(overlaps)
+
+        if self._all_prisms and other._all_prisms:
+            # Prism intersections are just the inner bounds; skip Region.__and__.
+            mins = np.maximum(self_mins[self_indices], other_mins[other_indices])
+            maxs = np.minimum(self_maxs[self_indices], other_maxs[other_indices])
+            non_empty = (mins <= maxs).all(axis=-1)
+            return [
+                RectangularPrism(Pos._make(min_pos), Pos._make(max_pos))
+                for min_pos, max_pos in zip(
+                    mins[non_empty].tolist(), maxs[non_empty].tolist(), strict=True
+                )
+            ]
+
+        return [
+            combined_region
+            for self_index, other_index in zip(
+                self_indices.tolist(), other_indices.tolist(), strict=True
+            )
+            if not (
+                combined_region := self.subregions[self_index]
+                & other.subregions[other_index]
+            ).is_empty()
+        ]
+
     def is_empty(self) -> bool:
         return all(region.is_empty() for region in self.subregions)
 
     @cached_property
     def points(self) -> frozenset[Pos]:
-        return frozenset.union(*(region.points for region in self.subregions))
+        return frozenset().union(*(region.points for region in self.subregions))
 
-    # TODO: Replace memory leaking @cache with id()-based caching.
-    @cache  # noqa: B019
+    @weak_id_cached
     def intersects(self, other: "Region") -> bool:
         # Fast AABB check.
-        if not (self.min_pos <= other.max_pos and self.max_pos >= other.min_pos):
+        if not _aabbs_overlap(self, other):
             return False
 
-        if isinstance(other, (PointRegion, RectangularPrism, CompositeRegion)):
-            return any(subregion.intersects(other) for subregion in self.subregions)
-        else:
+        if not isinstance(other, (PointRegion, RectangularPrism, CompositeRegion)):
             return other.intersects(self)
 
+        if len(self.subregions) >= _BVH_MIN_REGIONS:
+            return any(
+                self.subregions[index].intersects(other)
+                for index in self._bvh.overlapping(other._packed_min, other._packed_max)
+            )
+
+        return any(subregion.intersects(other) for subregion in self.subregions)
+
 
 def any_overlap(regions: list[Region]) -> bool:
     """
@@ -891,6 +1414,16 @@ def any_overlap(regions: list[Region]) -> bool:
     ... )
     True
     """
+    if len(regions) >= _BVH_MIN_REGIONS:
+        # Only test the pairs whose AABBs might overlap; O(n log n) if few do.
+        bvh = _BVHNode.build(regions)
+        return any(
+            left.intersects(regions[right_index])
+            for left_index, left in enumerate(regions)
+            for right_index in bvh.overlapping(left._packed_min, left._packed_max)
+            if right_index > left_index
+        )
+
     return any(
         # All Region.intersects() methods use a fail-fast AABB min/max check.
         # Still O(n^2), but reasonably fast if most pairs aren't in the same AABB region.
@@ -914,38 +1447,30 @@ def point_ranges(points: set[int], min_gap_size: int = 3) -> list[tuple[int, int
 
     >>> point_ranges({8, 10, 11, 15, 16, 19, 20}, min_gap_size=4)
     [(8, 20)]
+
+    >>> point_ranges(set())
+    Traceback (most recent call last):
+      ...
+    ValueError: Cannot find min element of empty set.
     """
-    lower_bound, upper_bound = min(points), max(points)
+    if not points:
+        raise ValueError("Cannot find min element of empty set.")
+
+    sorted_points = sorted(points)
 
     ranges: list[tuple[int, int]] = []
 
-    # Track the current distance to the last block (moving towards higher
-    # numbers) in gap_count and the current range's lower bound (reset to None
-    # once we get min_gap_size away from the current ranges and we carve it
-    # out).
-    gap_count = 0
-    current_lower_bound: int | None = None
-    for i in range(lower_bound, upper_bound + 1):
-        if i in points:
-            # current_lower_bound is None: New range!
-            # current_lower_bound is not None: Continue range, reset gap count
-            gap_count = 0
-            if current_lower_bound is None:
-                current_lower_bound = i
-        else:
-            # current_lower_bound is None: Not in a range, continue onwards.
-            # current_lower_bound is not None: In a range, end range and reset iff
-            # gap_count is >= min_gap_size.
-            gap_count += 1
-            if gap_count == min_gap_size:
-                assert current_lower_bound is not None  # For MyPy.
-                ranges.append((current_lower_bound, i - min_gap_size))
-                current_lower_bound = None
-
-    if current_lower_bound is not None:
-        return ranges + [(current_lower_bound, i)]
-    else:
-        return ranges
+    # Scan neighboring points (rather than every integer between the bounds),
+    # carving out a range wherever min_gap_size or more integers are missing.
+    current_lower_bound = previous_point = sorted_points[0]
+    for point in sorted_points[1:]:
+        if 0 < min_gap_size < point - previous_point:
+            ranges.append((current_lower_bound, previous_point))
+            current_lower_bound = point
+        previous_point = point
+
+    ranges.append((current_lower_bound, previous_point))
+    return ranges
 
 
 AxisData = TypeVar("AxisData")
@@ -966,24 +1491,58 @@ def partial_coord(
 def partial_coord(values, axis_index):
     if len(values) == 3:
         x, y, z = values
-        return [
-            (z, y),  # Prefer that 'Y' stay vertical when possible.
-            (x, z),
-            (x, y),
-        ][axis_index]
+        if axis_index == 0:
+            return (z, y)  # Prefer that 'Y' stay vertical when possible.
+        elif axis_index == 1:
+            return (x, z)
+        else:
+            return (x, y)
     else:
         x, y = values
-        return [
-            (y,),
-            (x,),
-        ][axis_index]
+        return (y,) if axis_index == 0 else (x,)
+
+
+def _region_coords_array(region: Region | np.ndarray) -> np.ndarray:
+    """Every point in a region (or an (N, 3) array of points), as an (N, 3) array."""
+    if isinstance(region, np.ndarray):
+        return region
+    elif isinstance(region, RectangularPrism):
+        return region.coords_array()
+    elif isinstance(region, PointRegion):
+        return region._arr
+
+    return np.array(list(region), dtype=np.int64).reshape(-1, 3)
+
+
+def _filled_range_offsets(
+    filled_ranges: list[tuple[int, int]], coords: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Display offsets of each coordinate (which must be in a filled range), and of
+    the '.' separators between ranges. Every range is padded by a blank on each
+    side.
+
+    >>> offsets, separators = _filled_range_offsets([(0, 1), (5, 5)], np.array([1, 5]))
+    >>> offsets.tolist(), separators.tolist()
+    ([2, 6], [4])
+    """
+    range_mins, range_maxs = np.array(filled_ranges).T
+    range_starts = np.concatenate(([0], np.cumsum(range_maxs - range_mins + 4)[:-1]))
+    range_indices = np.searchsorted(range_maxs, coords)
+    return (
+        coords - range_mins[range_indices] + range_starts[range_indices] + 1,
+        range_starts[1:] - 1,
+    )
 
 
 # TODO: Consider rewriting to simplify
-def display_regions_orthographic(regions: list[Region], axis: Axis) -> None:  # noqa: C901
+def display_regions_orthographic(
+    regions: list[Region | np.ndarray], axis: Axis
+) -> None:
     """
     "Compactly" display a list of regions in ASCII using an axis-aligned
     orthographic projection, removing empty space.
+    Regions may also be given directly as (N, 3) arrays of their points.
 
     >>> display_regions_orthographic(  # doctest: +NORMALIZE_WHITESPACE
     ...     regions=[
@@ -1016,7 +1575,8 @@ def display_regions_orthographic(regions: list[Region], axis: Axis) -> None:  #
            22222 .
                  .           Z  [(-1, 8), (15, 20)]
     """
-    axis_names = partial_coord(("X", "Y", "Z"), axes.index(axis))
+    axis_index = axes.index(axis)
+    axis_names = partial_coord(("X", "Y", "Z"), axis_index)
 
     region_symbols = "1234567890abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
     if len(regions) > len(region_symbols):
@@ -1024,26 +1584,29 @@ def display_regions_orthographic(regions: list[Region], axis: Axis) -> None:  #
             f"Cannot display more than {len(region_symbols)} distinct regions - "
             "not enough symbols. Please combine some regions."
         )
-    region_symbol = dict(zip(regions, region_symbols))
 
-    region_all_points = {
-        region: {partial_coord(pos, axes.index(axis)) for pos in region}
+    # Project every region's points at once, keeping partial_coord()'s axis order.
+    projected_columns = list(partial_coord((0, 1, 2), axis_index))
+    region_points = [
+        np.unique(_region_coords_array(region)[:, projected_columns], axis=0)
         for region in regions
-    }
-    all_points = set.union(*region_all_points.values())
-
-    # Handle overlaps gracefully: If point is already assigned a different
-    # region's symbol, assign it to '*'.
-    point_symbol = {}
-    for region, region_points in region_all_points.items():
-        for point in region_points:
-            if point in point_symbol:
-                point_symbol[point] = "*"
-            else:
-                point_symbol[point] = region_symbol[region]
-
-    x_filled_ranges = point_ranges({partial_coord(point, 1)[0] for point in all_points})
-    y_filled_ranges = point_ranges({partial_coord(point, 0)[0] for point in all_points})
+    ]
+    region_indices = np.repeat(
+        np.arange(len(regions)), [len(points) for points in region_points]
+    )
+
+    # Handle overlaps gracefully: If a point is in several regions, assign it '*'.
+    points, first_indices, region_counts = np.unique(
+        np.concatenate(region_points),
+        axis=0,
+        return_index=True,
+        return_counts=True,
+    )
+    symbols = np.array(list(region_symbols))[region_indices[first_indices]]
+    symbols[region_counts > 1] = "*"
+
+    x_filled_ranges = point_ranges(set(points[:, 0].tolist()))
+    y_filled_ranges = point_ranges(set(points[:, 1].tolist()))
 
     total_height = (
         sum(ymax - ymin + 1 + 2 for ymin, ymax in y_filled_ranges)
@@ -1056,50 +1619,23 @@ def display_regions_orthographic(regions: list[Region], axis: Axis) -> None:  #
         - 1
     )
 
-    spacing_line = ""
-    for index, (xmin, xmax) in enumerate(x_filled_ranges):
-        if index > 0:
-            spacing_line += "."
-        spacing_line += " " + " " * (xmax - xmin + 1) + " "
-
-    # Reversed order.
-    result_lines = []
-
-    xmin, xmax = x_filled_ranges[0][0], x_filled_ranges[-1][1]
-    ymin, ymax = y_filled_ranges[0][0], y_filled_ranges[-1][1]
-    for y_index, (range_y_min, range_y_max) in enumerate(y_filled_ranges):
-        if y_index > 0:
-            result_lines.append("." * total_width)
-
-        if y_index == 0:
-            result_lines.append(spacing_line + f"{axis_names[0]}  {y_filled_ranges}")
-        else:
-            result_lines.append(spacing_line)
-
-        for y in range(range_y_min, range_y_max + 1):
-            line = ""
-            for x_index, (range_x_min, range_x_max) in enumerate(x_filled_ranges):
-                if x_index > 0:
-                    line += "."
-                content = "".join(
-                    [
-                        point_symbol.get((x, y), " ")
-                        for x in range(range_x_min, range_x_max + 1)
-                    ]
-                )
-                line += " " + content + " "
-
-            result_lines.append(line)
-
-        result_lines.append(spacing_line)
+    # Blit every point into one character grid, bottom row first. Each filled
+    # range gets a blank border, with '.' separators between ranges.
+    grid = np.full((total_height, total_width), " ", dtype="U1")
+    point_cols, separator_cols = _filled_range_offsets(x_filled_ranges, points[:, 0])
+    point_rows, separator_rows = _filled_range_offsets(y_filled_ranges, points[:, 1])
+    grid[:, separator_cols] = "."
+    grid[separator_rows, :] = "."
+    grid[point_rows, point_cols] = symbols
 
-    result_lines.append(axis_names[1] + f"  {x_filled_ranges}")
+    lines = [axis_names[1] + f"  {x_filled_ranges}"]
+    lines.extend("".join(grid_row) for grid_row in grid[::-1])
+    lines[-1] += f"{axis_names[0]}  {y_filled_ranges}"
 
-    for line in reversed(result_lines):
-        print(line)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def display_regions(*regions: Region) -> None:
+def display_regions(*regions: Region | np.ndarray) -> None:
     for perspective_axis in ("x", "y", "z"):
         display_regions_orthographic(list(regions), cast(Axis, perspective_axis))
         print()
@@ -1,6 +1,6 @@
 #!/usr/bin/env python
-from functools import reduce
-import operator
+from argparse import ArgumentParser
+import pdb
 
 from frozendict import frozendict
 from visualize_bussing import display_step
@@ -22,11 +22,25 @@ from redhdl.netlist.netlist_template import (
     example_port_slice_assignments,
     netlist_from_simple_spec,
 )
-from redhdl.voxel.region import PointRegion, Pos, display_regions
+from redhdl.voxel.region import Pos, display_regions
 from redhdl.voxel.schematic import save_schem
 
 
+def arg_parser() -> ArgumentParser:
+    parser = ArgumentParser(
+        description="Bus an example placement, displaying the resulting buses.",
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="step through the interesting pin's search and break into pdb",
+    )
+    return parser
+
+
 def main():
+    args = arg_parser().parse_args()
+
     netlist = netlist_from_simple_spec(
         instance_config=example_instance_configs,
         port_slice_assignments=example_port_slice_assignments,
@@ -62,8 +76,9 @@ def main():
     display_regions(*instances_region.subregions)
 
     dest_pin_buses: PinBuses = {}
+    # Running union of dest_pin_buses.values().
+    other_buses = RedstoneBussing()
     for pin_pos_pair in source_dest_pin_pos_pairs(netlist, placement):
-        other_buses = reduce(operator.or_, dest_pin_buses.values(), RedstoneBussing())
         (
             bussing,
             problem,
@@ -85,7 +100,7 @@ def main():
             step.step for step in algo_steps if step.algo_action == "expanding_step"
         ]
 
-        debug = pin_pos_pair.source_pin_id == interesting_source_pin_id
+        debug = args.debug and pin_pos_pair.source_pin_id == interesting_source_pin_id
 
         if debug:
             for expansion_step in expansion_steps:
@@ -100,25 +115,19 @@ def main():
                 try:
                     input()
                 except KeyboardInterrupt:
-                    import pdb
-
                     pdb.set_trace()
 
-            import pdb
-
             pdb.set_trace()
 
         if bussing is None:
             raise ValueError(f"Failed to bus {pin_pos_pair.dest_pin_id}.")
 
         dest_pin_buses[pin_pos_pair.dest_pin_id] = bussing
+        other_buses |= bussing
 
     display_regions(
         *instances_region.subregions,
-        *(
-            PointRegion(frozenset(bus.element_blocks))
-            for bus in dest_pin_buses.values()
-        ),
+        *(bus.element_coords_array for bus in dest_pin_buses.values()),
     )
 
     schem = bussed_placement_schematic(netlist, placement, dest_pin_buses)
@@ -128,9 +137,8 @@ def main():
         f"output_schems/bussed_{placement_name}_placement.schem",
     )
 
-    import pdb
-
-    pdb.set_trace()
+    if args.debug:
+        pdb.set_trace()
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 #!/usr/bin/env python
+from os import stat
 from sys import argv
 from time import sleep
 
@@ -10,8 +11,18 @@ from redhdl.voxel.schematic import display_schematic, load_schem
 def main(schem_path, desc_file_path: str | None):
     plt.ion()
 
+    # Only reparse and redraw when one of the files has changed.
+    watched_paths = [path for path in (schem_path, desc_file_path) if path is not None]
+    last_mtimes = None
     while True:
         try:
+            mtimes = [stat(path).st_mtime for path in watched_paths]
+            if mtimes == last_mtimes:
+                # Nothing to redraw; keep the window responsive without a full pause.
+                plt.gcf().canvas.flush_events()
+                sleep(0.1)
+                continue
+
             schem = load_schem(schem_path)
 
             if desc_file_path is not None:
@@ -21,6 +32,7 @@ def main(schem_path, desc_file_path: str | None):
                 desc = ""
 
             display_schematic(schem, schem_path + "\n" + desc)
+            last_mtimes = mtimes
             plt.pause(0.1)
 
         except KeyboardInterrupt:
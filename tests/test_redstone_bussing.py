@@ -1,12 +1,45 @@
-from time import time
+from pytest import mark
 
-from redhdl.bussing.errors import BussingTimeoutError
 from redhdl.bussing.redstone_bussing import RedstoneBussing, redstone_bussing_details
 from redhdl.voxel.region import Pos
 
 
-def _test_search_durations():
+def diagonal_bussing_details(distance: int):
+    return redstone_bussing_details(
+        start_pos=Pos(0, 0, 0),
+        end_pos=Pos(distance, distance, distance),
+        start_xz_dir="south",
+        end_xz_dir="east",
+        instance_points=set(),
+        other_buses=RedstoneBussing(),
+        max_steps=5_000,
+    )
+
+
+def check_diagonal_bussing(benchmark, request, distance: int):
+    bussing, problem, states, steps, costs, algo_steps = benchmark.pedantic(
+        diagonal_bussing_details, args=(distance,), rounds=3
+    )
+    assert bussing is not None
+
+    if request.config.get_verbosity() > 0:
+        expanding_steps = [
+            step for step in algo_steps if step.algo_action == "expanding_step"
+        ]
+        print(distance, (distance + 1) ** 3, len(expanding_steps))
+
+
+@mark.parametrize("distance", [5, 10])
+def test_bussing_search(benchmark, request, distance):
+    check_diagonal_bussing(benchmark, request, distance)
+
+
+@mark.slow
+@mark.parametrize("distance", [30, 70])
+def test_bussing_search_scaling(benchmark, request, distance):
     """
+    Historical (distance, volume, seconds, expanded steps):
+
     5 216 0.02058696746826172 24
     10 1331 0.060437917709350586 49
     20 9261 0.19190597534179688 145
@@ -16,29 +49,4 @@ def _test_search_durations():
     60 226981 8.252267122268677 5483
     70 357911 12.555897951126099 4518
     """
-    durations = {}
-    start_time = time()
-    for distance in [5, 10, 30, 70]:
-        try:
-            bussing, problem, states, steps, costs, algo_steps = (
-                redstone_bussing_details(
-                    start_pos=Pos(0, 0, 0),
-                    # end_pos=Pos(3, 2, 2),
-                    end_pos=Pos(distance, distance, distance),
-                    start_xz_dir="south",
-                    end_xz_dir="east",
-                    instance_points=set(),
-                    other_buses=RedstoneBussing(),
-                    max_steps=5_000,
-                )
-            )
-            expanding_steps = [
-                step for step in algo_steps if step.algo_action == "expanding_step"
-            ]
-            durations[distance] = time() - start_time
-            print(
-                distance, (distance + 1) ** 3, durations[distance], len(expanding_steps)
-            )
-
-        except BussingTimeoutError:
-            break
+    check_diagonal_bussing(benchmark, request, distance)